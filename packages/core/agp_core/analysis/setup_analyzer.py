@@ -56,7 +56,7 @@ class SetupParameter:
     interactions: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sample:
     """Single telemetry sample"""
     timestamp: float
@@ -5,6 +5,8 @@ Broadcasts telemetry and setup recommendations to frontend
 
 import asyncio
 import json
+import math
+import struct
 import time
 from typing import Set
 
@@ -14,6 +16,38 @@ from agp_core.telemetry.rf2_shared_memory import RF2SharedMemory
 from agp_core.analysis.setup_analyzer import SetupAnalyzer
 
 
+# Packed telemetry frame, sent as a binary message to clients that asked for
+# {"type": "set_format", "format": "binary"}. Little-endian, no padding, fields
+# in this order with the same units as the JSON message (unrounded).
+# has_session / has_position say whether those blocks are filled.
+# Vehicle and track names are sent as JSON "telemetry_meta" when they change.
+TELEMETRY_FRAME_FIELDS = (
+    ('timestamp', 'd'),
+    ('speed', 'f'), ('rpm', 'f'), ('rpm_max', 'f'), ('gear', 'i'),
+    ('fuel', 'f'), ('fuel_pct', 'f'),
+    ('throttle', 'f'), ('brake', 'f'), ('steering', 'f'), ('clutch', 'f'),
+    ('g_lat', 'f'), ('g_long', 'f'),
+    ('tire_temp', '4f'), ('tire_pressure', '4f'), ('tire_wear', '4f'), ('grip', '4f'),
+    ('brake_temp', '4f'),
+    ('ride_height_front', 'f'), ('ride_height_rear', 'f'), ('rake', 'f'),
+    ('front_downforce', 'f'), ('rear_downforce', 'f'),
+    ('water_temp', 'f'), ('oil_temp', 'f'),
+    ('lap_number', 'i'), ('sector', 'i'),
+    ('pos_x', 'f'), ('pos_y', 'f'), ('pos_z', 'f'),
+    ('has_session', '?'),
+    ('track_temp', 'f'), ('ambient_temp', 'f'), ('rain', 'f'), ('wetness', 'f'),
+    ('session_type', 'i'), ('game_phase', 'i'),
+    ('has_position', '?'),
+    ('place', 'i'), ('total_laps', 'i'), ('best_lap', 'f'), ('last_lap', 'f'),
+    ('time_behind_leader', 'f'), ('time_behind_next', 'f'), ('in_pits', '?'),
+    ('pitstops', 'i'),
+)
+TELEMETRY_FRAME = struct.Struct('<' + ''.join(fmt for _, fmt in TELEMETRY_FRAME_FIELDS))
+
+_NO_SESSION = (False, math.nan, math.nan, math.nan, math.nan, 0, 0)
+_NO_POSITION = (False, 0, 0, math.nan, math.nan, math.nan, math.nan, False, 0)
+
+
 class AGPServer:
     """Main WebSocket server for AGP Strategy Suite"""
 
@@ -21,11 +55,17 @@ class AGPServer:
         self.host = host
         self.port = port
         self.clients: Set = set()
+        self.binary_clients: Set = set()  # Subset of clients taking TELEMETRY_FRAME
         self.rf2 = RF2SharedMemory()
         self.analyzer = SetupAnalyzer()
         self.running = False
         self.update_rate = 60  # Hz
 
+        # Reused for every binary frame; websockets.broadcast() writes it out
+        # to every client before returning
+        self._frame_buffer = bytearray(TELEMETRY_FRAME.size)
+        self._frame_meta = None  # (vehicle, track) last sent to binary clients
+
     async def register(self, websocket):
         """Register new client"""
         self.clients.add(websocket)
@@ -41,16 +81,50 @@ class AGPServer:
     async def unregister(self, websocket):
         """Unregister client"""
         self.clients.discard(websocket)
+        self.binary_clients.discard(websocket)
         print(f"[AGP] Client disconnected. Total: {len(self.clients)}")
 
-    async def broadcast(self, message: str):
-        """Broadcast message to all clients"""
-        if self.clients:
+    async def broadcast(self, message, clients: Set = None):
+        """Broadcast message to all clients, or to the given ones"""
+        if clients is None:
+            clients = self.clients
+        if clients:
             await asyncio.gather(
-                *[client.send(message) for client in self.clients],
+                *[client.send(message) for client in clients],
                 return_exceptions=True
             )
 
+    def _pack_telemetry_frame(self, timestamp: float, t, s, p) -> bytearray:
+        """Pack one tick into the shared TELEMETRY_FRAME buffer"""
+        if s:
+            session = (True, s.track_temp, s.ambient_temp, s.raining, s.avg_path_wetness,
+                       s.session_type, s.game_phase)
+        else:
+            session = _NO_SESSION
+        if p:
+            position = (True, p.place, p.total_laps,
+                        p.best_lap_time if p.best_lap_time > 0 else math.nan,
+                        p.last_lap_time if p.last_lap_time > 0 else math.nan,
+                        p.time_behind_leader, p.time_behind_next, p.in_pits, p.num_pitstops)
+        else:
+            position = _NO_POSITION
+
+        TELEMETRY_FRAME.pack_into(
+            self._frame_buffer, 0, timestamp,
+            t.speed_kmh, t.rpm, t.rpm_max, t.gear, t.fuel, t.fuel_pct,
+            t.throttle * 100, t.brake * 100, t.steering * 100, t.clutch * 100,
+            t.g_lat, t.g_long,
+            *t.tire_temps, *t.tire_pressures, *(t.tire_wear * 100), *(t.grips * 100),
+            *t.brake_temps,
+            t.front_ride_height, t.rear_ride_height, t.rake,
+            t.front_downforce, t.rear_downforce,
+            t.water_temp, t.oil_temp,
+            t.lap_number, t.current_sector,
+            t.pos_x, t.pos_y, t.pos_z,
+            *session, *position,
+        )
+        return self._frame_buffer
+
     async def handle_client(self, websocket, path=None):
         """Handle client connection"""
         await self.register(websocket)
@@ -109,6 +183,21 @@ class AGPServer:
                         "success": success
                     }))
 
+            elif msg_type == "set_format":
+                fmt = data.get("format")
+                if fmt == "binary":
+                    self.binary_clients.add(websocket)
+                    self._frame_meta = None  # Resend names to the new client
+                elif fmt == "json":
+                    self.binary_clients.discard(websocket)
+                else:
+                    raise ValueError(f"Unknown format: {fmt}")
+                await websocket.send(json.dumps({
+                    "type": "format",
+                    "format": fmt,
+                    "frame": [[name, code] for name, code in TELEMETRY_FRAME_FIELDS],
+                }))
+
             elif msg_type == "ping":
                 await websocket.send(json.dumps({
                     "type": "pong",
@@ -165,116 +254,137 @@ class AGPServer:
                         s = data['scoring']
                         p = data['player_scoring']
 
-                        broadcast_data = {
-                            "type": "telemetry",
-                            "timestamp": data['timestamp'],
-
-                            # Basic
-                            "vehicle": t.vehicle_name,
-                            "track": t.track_name,
-
-                            # Speed & Engine
-                            "speed": round(t.speed_kmh, 1),
-                            "rpm": round(t.rpm),
-                            "rpm_max": round(t.rpm_max),
-                            "gear": t.gear,
-                            "fuel": round(t.fuel, 1),
-                            "fuel_pct": round(t.fuel_pct, 1),
-
-                            # Inputs
-                            "throttle": round(t.throttle * 100, 1),
-                            "brake": round(t.brake * 100, 1),
-                            "steering": round(t.steering * 100, 1),
-                            "clutch": round(t.clutch * 100, 1),
-
-                            # G-Forces
-                            "g_lat": round(t.g_lat, 2),
-                            "g_long": round(t.g_long, 2),
-
-                            # Tires
-                            "tire_temp": {
-                                "FL": round(t.tire_temp_fl, 1),
-                                "FR": round(t.tire_temp_fr, 1),
-                                "RL": round(t.tire_temp_rl, 1),
-                                "RR": round(t.tire_temp_rr, 1)
-                            },
-                            "tire_pressure": {
-                                "FL": round(t.tire_pressure_fl, 1),
-                                "FR": round(t.tire_pressure_fr, 1),
-                                "RL": round(t.tire_pressure_rl, 1),
-                                "RR": round(t.tire_pressure_rr, 1)
-                            },
-                            "tire_wear": {
-                                "FL": round(t.tire_wear_fl * 100, 1),
-                                "FR": round(t.tire_wear_fr * 100, 1),
-                                "RL": round(t.tire_wear_rl * 100, 1),
-                                "RR": round(t.tire_wear_rr * 100, 1)
-                            },
-                            "grip": {
-                                "FL": round(t.grip_fl * 100, 1),
-                                "FR": round(t.grip_fr * 100, 1),
-                                "RL": round(t.grip_rl * 100, 1),
-                                "RR": round(t.grip_rr * 100, 1)
-                            },
-
-                            # Brakes
-                            "brake_temp": {
-                                "FL": round(t.brake_temp_fl, 1),
-                                "FR": round(t.brake_temp_fr, 1),
-                                "RL": round(t.brake_temp_rl, 1),
-                                "RR": round(t.brake_temp_rr, 1)
-                            },
-
-                            # Aero & Chassis
-                            "ride_height_front": round(t.front_ride_height, 1),
-                            "ride_height_rear": round(t.rear_ride_height, 1),
-                            "rake": round(t.rake, 1),
-                            "front_downforce": round(t.front_downforce, 1),
-                            "rear_downforce": round(t.rear_downforce, 1),
-
-                            # Engine temps
-                            "water_temp": round(t.water_temp, 1),
-                            "oil_temp": round(t.oil_temp, 1),
-
-                            # Lap
-                            "lap_number": t.lap_number,
-                            "sector": t.current_sector,
-
-                            # Position
-                            "pos_x": round(t.pos_x, 1),
-                            "pos_y": round(t.pos_y, 1),
-                            "pos_z": round(t.pos_z, 1),
-                        }
-
-                        # Add scoring data if available
-                        if s:
-                            broadcast_data["session"] = {
-                                "track_temp": round(s.track_temp, 1),
-                                "ambient_temp": round(s.ambient_temp, 1),
-                                "rain": round(s.raining, 2),
-                                "wetness": round(s.avg_path_wetness, 2),
-                                "session_type": s.session_type,
-                                "game_phase": s.game_phase
+                        if self.binary_clients:
+                            meta = (t.vehicle_name, t.track_name)
+                            if meta != self._frame_meta:
+                                self._frame_meta = meta
+                                await self.broadcast(json.dumps({
+                                    "type": "telemetry_meta",
+                                    "vehicle": t.vehicle_name,
+                                    "track": t.track_name,
+                                }), self.binary_clients)
+                            # Per-tick sends are written synchronously to each
+                            # transport instead of gathering one coroutine per client
+                            websockets.broadcast(
+                                self.binary_clients,
+                                self._pack_telemetry_frame(data['timestamp'], t, s, p))
+
+                        json_clients = self.clients - self.binary_clients
+                        if json_clients:
+                            broadcast_data = {
+                                "type": "telemetry",
+                                "timestamp": data['timestamp'],
+
+                                # Basic
+                                "vehicle": t.vehicle_name,
+                                "track": t.track_name,
+
+                                # Speed & Engine
+                                "speed": round(t.speed_kmh, 1),
+                                "rpm": round(t.rpm),
+                                "rpm_max": round(t.rpm_max),
+                                "gear": t.gear,
+                                "fuel": round(t.fuel, 1),
+                                "fuel_pct": round(t.fuel_pct, 1),
+
+                                # Inputs
+                                "throttle": round(t.throttle * 100, 1),
+                                "brake": round(t.brake * 100, 1),
+                                "steering": round(t.steering * 100, 1),
+                                "clutch": round(t.clutch * 100, 1),
+
+                                # G-Forces
+                                "g_lat": round(t.g_lat, 2),
+                                "g_long": round(t.g_long, 2),
+
+                                # Tires
+                                "tire_temp": {
+                                    "FL": round(t.tire_temp_fl, 1),
+                                    "FR": round(t.tire_temp_fr, 1),
+                                    "RL": round(t.tire_temp_rl, 1),
+                                    "RR": round(t.tire_temp_rr, 1)
+                                },
+                                "tire_pressure": {
+                                    "FL": round(t.tire_pressure_fl, 1),
+                                    "FR": round(t.tire_pressure_fr, 1),
+                                    "RL": round(t.tire_pressure_rl, 1),
+                                    "RR": round(t.tire_pressure_rr, 1)
+                                },
+                                "tire_wear": {
+                                    "FL": round(t.tire_wear_fl * 100, 1),
+                                    "FR": round(t.tire_wear_fr * 100, 1),
+                                    "RL": round(t.tire_wear_rl * 100, 1),
+                                    "RR": round(t.tire_wear_rr * 100, 1)
+                                },
+                                "grip": {
+                                    "FL": round(t.grip_fl * 100, 1),
+                                    "FR": round(t.grip_fr * 100, 1),
+                                    "RL": round(t.grip_rl * 100, 1),
+                                    "RR": round(t.grip_rr * 100, 1)
+                                },
+
+                                # Brakes
+                                "brake_temp": {
+                                    "FL": round(t.brake_temp_fl, 1),
+                                    "FR": round(t.brake_temp_fr, 1),
+                                    "RL": round(t.brake_temp_rl, 1),
+                                    "RR": round(t.brake_temp_rr, 1)
+                                },
+
+                                # Aero & Chassis
+                                "ride_height_front": round(t.front_ride_height, 1),
+                                "ride_height_rear": round(t.rear_ride_height, 1),
+                                "rake": round(t.rake, 1),
+                                "front_downforce": round(t.front_downforce, 1),
+                                "rear_downforce": round(t.rear_downforce, 1),
+
+                                # Engine temps
+                                "water_temp": round(t.water_temp, 1),
+                                "oil_temp": round(t.oil_temp, 1),
+
+                                # Lap
+                                "lap_number": t.lap_number,
+                                "sector": t.current_sector,
+
+                                # Position
+                                "pos_x": round(t.pos_x, 1),
+                                "pos_y": round(t.pos_y, 1),
+                                "pos_z": round(t.pos_z, 1),
                             }
 
-                        if p:
-                            broadcast_data["position"] = {
-                                "place": p.place,
-                                "total_laps": p.total_laps,
-                                "best_lap": round(p.best_lap_time, 3) if p.best_lap_time > 0 else None,
-                                "last_lap": round(p.last_lap_time, 3) if p.last_lap_time > 0 else None,
-                                "time_behind_leader": round(p.time_behind_leader, 3),
-                                "time_behind_next": round(p.time_behind_next, 3),
-                                "in_pits": p.in_pits,
-                                "pitstops": p.num_pitstops
-                            }
-
-                        # Add analysis summary
-                        summary = self.analyzer.get_summary()
-                        if summary.get("status") == "ready":
-                            broadcast_data["analysis"] = summary
-
-                        await self.broadcast(json.dumps(broadcast_data))
+                            # Add scoring data if available
+                            if s:
+                                broadcast_data["session"] = {
+                                    "track_temp": round(s.track_temp, 1),
+                                    "ambient_temp": round(s.ambient_temp, 1),
+                                    "rain": round(s.raining, 2),
+                                    "wetness": round(s.avg_path_wetness, 2),
+                                    "session_type": s.session_type,
+                                    "game_phase": s.game_phase
+                                }
+
+                            if p:
+                                broadcast_data["position"] = {
+                                    "place": p.place,
+                                    "total_laps": p.total_laps,
+                                    "best_lap": (
+                                        round(p.best_lap_time, 3) if p.best_lap_time > 0 else None
+                                    ),
+                                    "last_lap": (
+                                        round(p.last_lap_time, 3) if p.last_lap_time > 0 else None
+                                    ),
+                                    "time_behind_leader": round(p.time_behind_leader, 3),
+                                    "time_behind_next": round(p.time_behind_next, 3),
+                                    "in_pits": p.in_pits,
+                                    "pitstops": p.num_pitstops
+                                }
+
+                            # Add analysis summary
+                            summary = self.analyzer.get_summary()
+                            if summary.get("status") == "ready":
+                                broadcast_data["analysis"] = summary
+
+                            websockets.broadcast(json_clients, json.dumps(broadcast_data))
 
                 else:
                     await asyncio.sleep(0.1)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
 
 from agp_core.strategy.models import FuelState, PitStop, PitStopType
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelPrediction:
     """Fuel prediction result."""
     laps_remaining: float
@@ -28,25 +31,140 @@ class FuelPrediction:
         }
 
 
+def _laps_remaining(current_fuel: float, consumption: float, trend: float) -> float:
+    """Laps the fuel lasts at a consumption, partially adjusted for the trend."""
+    if consumption <= 0:
+        return float('inf')
+
+    adjusted_consumption = consumption + (trend * 0.5)  # Partial trend adjustment
+    return current_fuel / max(adjusted_consumption, 0.1)
+
+
+def _pit_window(
+    laps_remaining: float,
+    tank_capacity: float,
+    avg_consumption: float,
+    safety_margin_laps: float,
+    current_lap: int,
+    total_laps: int,
+) -> tuple[int, int]:
+    """(earliest_lap, latest_lap) for pitting."""
+    # Latest safe lap to pit (with safety margin)
+    latest_lap = current_lap + int(laps_remaining - safety_margin_laps)
+
+    # Earliest optimal is when tire deg or fuel makes pitting worthwhile
+    # This is simplified - real calculation would consider tire state
+    laps_to_half_tank = (tank_capacity / 2) / (avg_consumption or 3.0)
+    earliest_lap = current_lap + max(5, int(laps_to_half_tank * 0.7))
+
+    # Ensure window is valid
+    latest_lap = min(latest_lap, total_laps - 1)
+    earliest_lap = min(earliest_lap, latest_lap - 3)
+
+    return (max(current_lap + 1, earliest_lap), latest_lap)
+
+
+def _fuel_to_add(
+    target_laps: float,
+    consumption: float,
+    safety_margin_laps: float,
+    current_fuel: float,
+    tank_capacity: float,
+) -> tuple[float, float]:
+    """(fuel_needed, fuel_to_add) to run target_laps plus the safety margin."""
+    fuel_needed = (target_laps * consumption) + (safety_margin_laps * consumption)
+    fuel_to_add = fuel_needed - current_fuel
+
+    # Don't exceed tank capacity
+    max_add = tank_capacity - current_fuel
+    fuel_to_add = min(fuel_to_add, max_add)
+
+    return fuel_needed, max(0, fuel_to_add)
+
+
+@lru_cache(maxsize=64)
+def _predict_core(
+    current_fuel: float,
+    tank_capacity: float,
+    consumption_per_lap: float,
+    avg_consumption: float,
+    trend: float,
+    safety_margin_laps: float,
+    current_lap: int,
+    total_laps: int,
+) -> tuple[float, int, int, float, float, bool]:
+    """
+    Scalar core of FuelCalculator.predict.
+
+    Runs the same helpers as the calculate_* methods, but with the history
+    average and trend computed once by the caller instead of once per method.
+    Pure function of its arguments, so repeated polls with an unchanged
+    state are served from the cache.
+    Returns (laps_remaining, window_start, window_end, fuel_needed,
+    recommended_add, is_critical).
+    """
+    consumption = avg_consumption or consumption_per_lap
+    laps_remaining = _laps_remaining(current_fuel, consumption, trend)
+    window_start, window_end = _pit_window(
+        laps_remaining, tank_capacity, avg_consumption, safety_margin_laps,
+        current_lap, total_laps,
+    )
+
+    race_laps_remaining = total_laps - current_lap
+    fuel_needed, recommended_add = _fuel_to_add(
+        race_laps_remaining, consumption, safety_margin_laps, current_fuel, tank_capacity
+    )
+
+    is_critical = laps_remaining < 3 or (
+        laps_remaining < race_laps_remaining and window_end <= current_lap + 2
+    )
+
+    return (laps_remaining, window_start, window_end, fuel_needed, recommended_add, is_critical)
+
+
 class FuelCalculator:
     """Calculator for fuel strategy."""
 
+    HISTORY_SIZE = 20  # Laps of consumption kept for averages
+
     def __init__(self):
-        self.consumption_history: list[float] = []
+        # Oldest first, valid values in _hist[:_hist_n]
+        self._hist = np.zeros(self.HISTORY_SIZE, dtype=np.float64)
+        self._hist_n: int = 0
         self.safety_margin_laps: float = 1.5  # Extra laps of fuel as safety
 
+    @property
+    def consumption_history(self) -> list[float]:
+        """
+        Recorded consumption per lap, oldest first.
+
+        Returns a copy: record laps with update_consumption(), or assign a
+        new list to replace the history (only the last HISTORY_SIZE values
+        are kept).
+        """
+        return self._hist[:self._hist_n].tolist()
+
+    @consumption_history.setter
+    def consumption_history(self, history: Sequence[float]) -> None:
+        values = list(history)[-self.HISTORY_SIZE:]
+        self._hist[:len(values)] = values
+        self._hist_n = len(values)
+
     def update_consumption(self, fuel_used: float) -> None:
         """Record fuel consumption for a lap."""
         if fuel_used > 0:
-            self.consumption_history.append(fuel_used)
-            # Keep last 20 laps
-            self.consumption_history = self.consumption_history[-20:]
+            if self._hist_n < self.HISTORY_SIZE:
+                self._hist[self._hist_n] = fuel_used
+                self._hist_n += 1
+            else:
+                # Keep last 20 laps
+                self._hist[:-1] = self._hist[1:]
+                self._hist[-1] = fuel_used
 
     def get_average_consumption(self) -> float:
         """Get average fuel consumption per lap."""
-        if not self.consumption_history:
-            return 0
-        return sum(self.consumption_history) / len(self.consumption_history)
+        n = self._hist_n
+        return 0.0 if n == 0 else float(self._hist[:n].sum()) / n
 
     def get_consumption_trend(self) -> float:
         """
@@ -54,28 +172,20 @@ class FuelCalculator:
         Positive = increasing consumption
         Negative = decreasing consumption
         """
-        if len(self.consumption_history) < 5:
+        n = self._hist_n
+        if n < 5:
             return 0
 
-        recent = self.consumption_history[-5:]
-        older = self.consumption_history[-10:-5] if len(self.consumption_history) >= 10 else self.consumption_history[:5]
-
-        recent_avg = sum(recent) / len(recent)
-        older_avg = sum(older) / len(older)
+        history = self._hist[:n]
+        recent_avg = history[-5:].mean()
+        older_avg = history[-10:-5].mean() if n >= 10 else history[:5].mean()
 
-        return recent_avg - older_avg
+        return float(recent_avg - older_avg)
 
     def calculate_laps_remaining(self, fuel_state: FuelState) -> float:
         """Calculate laps remaining on current fuel."""
         consumption = self.get_average_consumption() or fuel_state.consumption_per_lap
-        if consumption <= 0:
-            return float('inf')
-
-        # Account for consumption trend
-        trend = self.get_consumption_trend()
-        adjusted_consumption = consumption + (trend * 0.5)  # Partial trend adjustment
-
-        return fuel_state.current_fuel / max(adjusted_consumption, 0.1)
+        return _laps_remaining(fuel_state.current_fuel, consumption, self.get_consumption_trend())
 
     def calculate_pit_window(
         self,
@@ -90,37 +200,30 @@ class FuelCalculator:
 
         Returns (earliest_lap, latest_lap) for pitting.
         """
-        laps_remaining = self.calculate_laps_remaining(fuel_state)
-
-        # Latest safe lap to pit (with safety margin)
-        latest_lap = current_lap + int(laps_remaining - self.safety_margin_laps)
-
-        # For strategy, calculate if we should pit early for undercut
-        pit_loss_laps = pit_loss_seconds / lap_time_seconds
-
-        # Earliest optimal is when tire deg or fuel makes pitting worthwhile
-        # This is simplified - real calculation would consider tire state
-        laps_to_half_tank = (fuel_state.tank_capacity / 2) / (self.get_average_consumption() or 3.0)
-        earliest_lap = current_lap + max(5, int(laps_to_half_tank * 0.7))
-
-        # Ensure window is valid
-        latest_lap = min(latest_lap, total_laps - 1)
-        earliest_lap = min(earliest_lap, latest_lap - 3)
-
-        return (max(current_lap + 1, earliest_lap), latest_lap)
+        # pit_loss_seconds and lap_time_seconds are accepted for callers but
+        # not used by the simplified window
+        return _pit_window(
+            self.calculate_laps_remaining(fuel_state),
+            fuel_state.tank_capacity,
+            self.get_average_consumption(),
+            self.safety_margin_laps,
+            current_lap,
+            total_laps,
+        )
 
     def calculate_fuel_for_laps(
         self,
-        laps: int,
+        laps: int | np.ndarray,
         fuel_state: FuelState,
         include_safety: bool = True,
-    ) -> float:
-        """Calculate fuel needed for a given number of laps."""
+    ) -> float | np.ndarray:
+        """Calculate fuel needed for a given number of laps (scalar or array of laps)."""
         consumption = self.get_average_consumption() or fuel_state.consumption_per_lap
         base_fuel = laps * consumption
 
         if include_safety:
-            base_fuel += self.safety_margin_laps * consumption
+            # Not +=: an int array of laps can't hold the float result
+            base_fuel = base_fuel + self.safety_margin_laps * consumption
 
         return base_fuel
 
@@ -140,14 +243,13 @@ class FuelCalculator:
             # Fuel to end of race
             target_laps = laps_to_end
 
-        fuel_needed = (target_laps * consumption) + (self.safety_margin_laps * consumption)
-        fuel_to_add = fuel_needed - fuel_state.current_fuel
-
-        # Don't exceed tank capacity
-        max_add = fuel_state.tank_capacity - fuel_state.current_fuel
-        fuel_to_add = min(fuel_to_add, max_add)
-
-        return max(0, fuel_to_add)
+        return _fuel_to_add(
+            target_laps,
+            consumption,
+            self.safety_margin_laps,
+            fuel_state.current_fuel,
+            fuel_state.tank_capacity,
+        )[1]
 
     def predict(
         self,
@@ -157,22 +259,28 @@ class FuelCalculator:
         lap_time: float = 120.0,
     ) -> FuelPrediction:
         """Generate complete fuel prediction."""
-        laps_remaining = self.calculate_laps_remaining(fuel_state)
-        pit_window = self.calculate_pit_window(
-            fuel_state, current_lap, total_laps,
-            lap_time_seconds=lap_time
+        (
+            laps_remaining,
+            window_start,
+            window_end,
+            fuel_needed,
+            recommended_add,
+            is_critical,
+        ) = _predict_core(
+            fuel_state.current_fuel,
+            fuel_state.tank_capacity,
+            fuel_state.consumption_per_lap,
+            self.get_average_consumption(),
+            self.get_consumption_trend(),
+            self.safety_margin_laps,
+            current_lap,
+            total_laps,
         )
 
-        race_laps_remaining = total_laps - current_lap
-        fuel_needed = self.calculate_fuel_for_laps(race_laps_remaining, fuel_state)
-        recommended_add = self.calculate_optimal_fuel_add(fuel_state, race_laps_remaining)
-
-        is_critical = laps_remaining < 3 or (laps_remaining < race_laps_remaining and pit_window[1] <= current_lap + 2)
-
         return FuelPrediction(
             laps_remaining=laps_remaining,
-            pit_window_start=pit_window[0],
-            pit_window_end=pit_window[1],
+            pit_window_start=window_start,
+            pit_window_end=window_end,
             fuel_needed_to_finish=fuel_needed,
             recommended_fuel_add=recommended_add,
             is_critical=is_critical,
@@ -1,22 +1,34 @@
 """Data models for strategy calculations"""
 
 from __future__ import annotations
+from bisect import bisect_right, insort
+from copy import copy
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum, StrEnum
+from itertools import islice
+from operator import attrgetter, itemgetter
+from statistics import fmean
 from typing import Any
 
 
-class TireCompound(Enum):
+# TireCompound values double as array indices for the vectorized strategy
+# code; to_dict() writes them out through _COMPOUND_LABELS.
+class TireCompound(IntEnum):
     """Available tire compounds."""
-    SOFT = "soft"
-    MEDIUM = "medium"
-    HARD = "hard"
-    WET = "wet"
-    INTERMEDIATE = "intermediate"
+    SOFT = 0
+    MEDIUM = 1
+    HARD = 2
+    WET = 3
+    INTERMEDIATE = 4
 
 
-class PitStopType(Enum):
+_COMPOUND_LABELS = ("soft", "medium", "hard", "wet", "intermediate")
+
+
+# The other enums are str subclasses: members serialize as their value, so
+# to_dict() can store them as-is.
+class PitStopType(StrEnum):
     """Type of pit stop."""
     FUEL_ONLY = "fuel_only"
     TIRES_ONLY = "tires_only"
@@ -25,7 +37,7 @@ class PitStopType(Enum):
     REPAIR = "repair"
 
 
-class WeatherCondition(Enum):
+class WeatherCondition(StrEnum):
     """Weather conditions."""
     DRY = "dry"
     LIGHT_RAIN = "light_rain"
@@ -33,34 +45,89 @@ class WeatherCondition(Enum):
     MIXED = "mixed"
 
 
-@dataclass
+# Tire age (laps) at which each compound falls off the cliff
+TIRE_CLIFF_LAPS = {
+    TireCompound.SOFT: 18,
+    TireCompound.MEDIUM: 28,
+    TireCompound.HARD: 40,
+    TireCompound.INTERMEDIATE: 24,
+    TireCompound.WET: 32,
+}
+
+
+# Sort keys for the lap-ordered lists below
+_CHANGE_LAP_KEY = itemgetter(0)
+_STOP_LAP_KEY = attrgetter("lap")
+
+
+@dataclass(frozen=True, slots=True)
 class FuelState:
-    """Current fuel state."""
+    """Current fuel state. Immutable: updates produce a new instance."""
     current_fuel: float  # liters
     tank_capacity: float  # liters
     consumption_per_lap: float  # liters/lap
-    consumption_history: list[float] = field(default_factory=list)
+    consumption_history: tuple[float, ...] = ()
+
+    # Derived values, computed once in __post_init__
+    _fuel_percentage: float = field(default=0.0, init=False, repr=False, compare=False)
+    _laps_remaining: float = field(default=0.0, init=False, repr=False, compare=False)
+    _average_consumption: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    # Running total of consumption_history, carried over by add_consumption
+    _sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        history = self.consumption_history
+        if type(history) is not tuple:
+            history = tuple(history)
+        set_ = object.__setattr__
+        set_(self, "consumption_history", history)
+        set_(self, "_sum", sum(history))
+        set_(self, "_count", len(history))
+        set_(self, "_fuel_percentage", (
+            0 if self.tank_capacity <= 0
+            else (self.current_fuel / self.tank_capacity) * 100
+        ))
+        set_(self, "_laps_remaining", (
+            float('inf') if self.consumption_per_lap <= 0
+            else self.current_fuel / self.consumption_per_lap
+        ))
+        set_(self, "_average_consumption", (
+            self._sum / self._count if history else self.consumption_per_lap
+        ))
+
+    def add_consumption(self, fuel_used: float) -> FuelState:
+        """
+        Return a copy with a lap consumption appended to the history.
+
+        The running total is carried into the copy instead of re-summing
+        the history, so the new average is O(1).
+        """
+        new = copy(self)
+        total = self._sum + fuel_used
+        count = self._count + 1
+        set_ = object.__setattr__
+        set_(new, "consumption_history", self.consumption_history + (fuel_used,))
+        set_(new, "_sum", total)
+        set_(new, "_count", count)
+        set_(new, "_average_consumption", total / count)
+        return new
 
     @property
     def fuel_percentage(self) -> float:
         """Fuel level as percentage."""
-        if self.tank_capacity <= 0:
-            return 0
-        return (self.current_fuel / self.tank_capacity) * 100
+        return self._fuel_percentage
 
     @property
     def laps_remaining(self) -> float:
         """Estimated laps remaining on current fuel."""
-        if self.consumption_per_lap <= 0:
-            return float('inf')
-        return self.current_fuel / self.consumption_per_lap
+        return self._laps_remaining
 
     @property
     def average_consumption(self) -> float:
         """Average fuel consumption from history."""
-        if not self.consumption_history:
-            return self.consumption_per_lap
-        return sum(self.consumption_history) / len(self.consumption_history)
+        return self._average_consumption
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -73,7 +140,7 @@ class FuelState:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TireState:
     """Current tire state for one set."""
     compound: TireCompound
@@ -88,37 +155,56 @@ class TireState:
     temp_rr: float = 80.0
     grip_level: float = 100.0  # percentage
 
+    # Derived values, computed once in __post_init__
+    _average_wear: float = field(default=0.0, init=False, repr=False, compare=False)
+    _worst_wear: float = field(default=0.0, init=False, repr=False, compare=False)
+    _estimated_laps_remaining: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        wear = (self.wear_fl, self.wear_fr, self.wear_rl, self.wear_rr)
+        set_ = object.__setattr__
+        set_(self, "_average_wear", fmean(wear))
+        set_(self, "_worst_wear", min(wear))
+        set_(self, "_estimated_laps_remaining", self._estimate_laps_remaining())
+
     @property
     def average_wear(self) -> float:
         """Average wear across all tires."""
-        return (self.wear_fl + self.wear_fr + self.wear_rl + self.wear_rr) / 4
+        return self._average_wear
 
     @property
     def worst_wear(self) -> float:
         """Worst (lowest) wear value."""
-        return min(self.wear_fl, self.wear_fr, self.wear_rl, self.wear_rr)
+        return self._worst_wear
 
     @property
     def estimated_laps_remaining(self) -> int:
         """Estimated laps before tires are worn out."""
+        return self._estimated_laps_remaining
+
+    def _estimate_laps_remaining(self) -> int:
+        # Laps until the compound's cliff; measured wear can only shorten it
+        to_cliff = max(0, TIRE_CLIFF_LAPS.get(self.compound, 28) - self.age_laps)
         if self.age_laps == 0:
-            return 50  # Default estimate
-        wear_per_lap = (100 - self.average_wear) / self.age_laps
+            return to_cliff
+        average_wear = self._average_wear
+        wear_per_lap = (100 - average_wear) / self.age_laps
         if wear_per_lap <= 0:
-            return 100
-        remaining_wear = self.average_wear - 20  # 20% is minimum
-        return int(remaining_wear / wear_per_lap)
+            return to_cliff
+        remaining_wear = average_wear - 20  # 20% is minimum
+        return max(0, min(to_cliff, int(remaining_wear / wear_per_lap)))
 
     def to_dict(self) -> dict[str, Any]:
+        average_wear = self.average_wear
         return {
-            "compound": self.compound.value,
+            "compound": _COMPOUND_LABELS[self.compound],
             "age_laps": self.age_laps,
             "wear": {
                 "fl": self.wear_fl,
                 "fr": self.wear_fr,
                 "rl": self.wear_rl,
                 "rr": self.wear_rr,
-                "average": self.average_wear,
+                "average": average_wear,
                 "worst": self.worst_wear,
             },
             "grip_level": self.grip_level,
@@ -126,7 +212,7 @@ class TireState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherForecast:
     """Weather forecast for strategy planning."""
     current_condition: WeatherCondition
@@ -135,25 +221,28 @@ class WeatherForecast:
     rain_probability: float  # 0-1
     forecast_changes: list[tuple[int, WeatherCondition]] = field(default_factory=list)  # (lap, condition)
 
+    def __post_init__(self) -> None:
+        # Kept sorted by lap so lookups can bisect
+        self.forecast_changes.sort(key=_CHANGE_LAP_KEY)
+
     def get_condition_at_lap(self, lap: int) -> WeatherCondition:
         """Get predicted weather at a specific lap."""
-        condition = self.current_condition
-        for change_lap, new_condition in self.forecast_changes:
-            if lap >= change_lap:
-                condition = new_condition
-        return condition
+        idx = bisect_right(self.forecast_changes, lap, key=_CHANGE_LAP_KEY)
+        if idx:
+            return self.forecast_changes[idx - 1][1]
+        return self.current_condition
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "current_condition": self.current_condition.value,
+            "current_condition": self.current_condition,
             "track_temp": self.track_temp,
             "air_temp": self.air_temp,
             "rain_probability": self.rain_probability,
-            "forecast_changes": [(lap, cond.value) for lap, cond in self.forecast_changes],
+            "forecast_changes": list(self.forecast_changes),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PitStop:
     """Planned or completed pit stop."""
     lap: int
@@ -167,11 +256,12 @@ class PitStop:
     completed: bool = False
 
     def to_dict(self) -> dict[str, Any]:
+        compound = self.tire_compound
         return {
             "lap": self.lap,
-            "stop_type": self.stop_type.value,
+            "stop_type": self.stop_type,
             "fuel_to_add": self.fuel_to_add,
-            "tire_compound": self.tire_compound.value if self.tire_compound else None,
+            "tire_compound": None if compound is None else _COMPOUND_LABELS[compound],
             "driver_in": self.driver_in,
             "driver_out": self.driver_out,
             "estimated_duration": self.estimated_duration,
@@ -180,7 +270,7 @@ class PitStop:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Stint:
     """A stint between pit stops."""
     stint_number: int
@@ -202,22 +292,23 @@ class Stint:
         return self.end_lap - self.start_lap
 
     def to_dict(self) -> dict[str, Any]:
+        end_lap = self.end_lap
         return {
             "stint_number": self.stint_number,
             "driver": self.driver,
             "start_lap": self.start_lap,
-            "end_lap": self.end_lap,
-            "tire_compound": self.tire_compound.value,
+            "end_lap": end_lap,
+            "tire_compound": _COMPOUND_LABELS[self.tire_compound],
             "fuel_start": self.fuel_start,
             "fuel_end": self.fuel_end,
             "laps_completed": self.laps_completed,
-            "planned_length": self.planned_length,
+            "planned_length": None if end_lap is None else end_lap - self.start_lap,
             "average_lap_time": self.average_lap_time,
             "best_lap_time": self.best_lap_time,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyPlan:
     """Complete race strategy plan."""
     race_laps: int
@@ -237,6 +328,14 @@ class StrategyPlan:
     current_stint: int = 0
     elapsed_time: float = 0.0
 
+    def __post_init__(self) -> None:
+        # Kept sorted by lap so next_pit_stop can bisect
+        self.pit_stops.sort(key=_STOP_LAP_KEY)
+
+    def add_pit_stop(self, stop: PitStop) -> None:
+        """Insert a pit stop, keeping pit_stops sorted by lap."""
+        insort(self.pit_stops, stop, key=_STOP_LAP_KEY)
+
     @property
     def laps_remaining(self) -> int:
         """Laps remaining in the race."""
@@ -250,21 +349,23 @@ class StrategyPlan:
     @property
     def next_pit_stop(self) -> PitStop | None:
         """Get next planned pit stop."""
-        for stop in self.pit_stops:
-            if not stop.completed and stop.lap > self.current_lap:
+        idx = bisect_right(self.pit_stops, self.current_lap, key=_STOP_LAP_KEY)
+        for stop in islice(self.pit_stops, idx, None):
+            if not stop.completed:
                 return stop
         return None
 
     def to_dict(self) -> dict[str, Any]:
+        next_stop = self.next_pit_stop
         return {
             "race_laps": self.race_laps,
             "race_duration": self.race_duration,
-            "pit_stops": [stop.to_dict() for stop in self.pit_stops],
-            "stints": [stint.to_dict() for stint in self.stints],
+            "pit_stops": list(map(PitStop.to_dict, self.pit_stops)),
+            "stints": list(map(Stint.to_dict, self.stints)),
             "drivers": self.drivers,
             "current_lap": self.current_lap,
             "current_stint": self.current_stint,
             "laps_remaining": self.laps_remaining,
             "time_remaining": self.time_remaining,
-            "next_pit_stop": self.next_pit_stop.to_dict() if self.next_pit_stop else None,
+            "next_pit_stop": next_stop.to_dict() if next_stop else None,
         }
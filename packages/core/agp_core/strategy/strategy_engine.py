@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Callable
 
+import numpy as np
+
 from agp_core.strategy.models import (
+    TIRE_CLIFF_LAPS,
     FuelState,
     TireState,
     TireCompound,
@@ -16,10 +20,40 @@ from agp_core.strategy.models import (
     StrategyPlan,
 )
 from agp_core.strategy.fuel_calculator import FuelCalculator, FuelPrediction
-from agp_core.strategy.tire_predictor import TirePredictor, TirePrediction
+from agp_core.strategy.strategy_engine_kernels import score_plans, split_race
+from agp_core.strategy.tire_predictor import (
+    COMPOUNDS,
+    WEATHER_CONDITIONS,
+    TirePredictor,
+    TirePrediction,
+)
+
+
+def _fit_tire_deg(compound: TireCompound) -> float:
+    """
+    Least-squares tire_deg for a compound, so that tire_deg * laps^2
+    tracks TirePredictor.calculate_time_loss for a new set run at the
+    default wear rate, for every stint length up to the cliff.
+    """
+    predictor = TirePredictor()
+    new_set = TireState(compound=compound)
+    rate = TirePredictor.DEGRADATION_RATES[compound]
+    laps = np.arange(1, TIRE_CLIFF_LAPS[compound] + 1)
+    loss = np.array([predictor.calculate_time_loss(new_set, n, rate) for n in laps.tolist()])
+    return float((loss * laps**2).sum() / (laps**4).sum())
+
+
+# Stint time cost coefficient (seconds per lap^2), indexed like COMPOUNDS
+_TIRE_DEG = np.array([_fit_tire_deg(c) for c in COMPOUNDS])
 
+# Tire cliff (laps), indexed like COMPOUNDS
+_TIRE_CLIFF = np.array([TIRE_CLIFF_LAPS[c] for c in COMPOUNDS])
 
-@dataclass
+# Recommendations are returned most urgent (lowest priority) first
+_PRIORITY_KEY = attrgetter("priority")
+
+
+@dataclass(slots=True)
 class StrategyRecommendation:
     """Strategy recommendation from the engine."""
     action: str  # "pit_now", "pit_soon", "stay_out", "prepare_wet"
@@ -38,7 +72,7 @@ class StrategyRecommendation:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UndercutAnalysis:
     """Analysis for undercut/overcut opportunities."""
     target_driver: str
@@ -67,6 +101,28 @@ class StrategyEngine:
     optimal pit stop strategies and real-time recommendations.
     """
 
+    __slots__ = (
+        "fuel_calculator",
+        "tire_predictor",
+        "fuel_state",
+        "tire_state",
+        "weather",
+        "strategy_plan",
+        "current_lap",
+        "total_laps",
+        "race_duration_hours",
+        "average_lap_time",
+        "pit_loss_time",
+        "on_recommendation",
+        "_state_version",
+        "_fuel_pred_cache",
+        "_tire_pred_cache",
+        "_dict_cache",
+        "_undercut_cache",
+    )
+
+    UNDERCUT_CACHE_SIZE = 256  # analyze_undercut results kept per state version
+
     def __init__(self):
         self.fuel_calculator = FuelCalculator()
         self.tire_predictor = TirePredictor()
@@ -87,6 +143,13 @@ class StrategyEngine:
         # Callbacks
         self.on_recommendation: Callable[[StrategyRecommendation], None] | None = None
 
+        # Bumped by every update_*; predictions are cached per version (see _cache_key)
+        self._state_version: int = 0
+        self._fuel_pred_cache: tuple[tuple, FuelPrediction | None] | None = None
+        self._tire_pred_cache: tuple[tuple, TirePrediction | None] | None = None
+        self._dict_cache: tuple[tuple, dict[str, Any]] | None = None
+        self._undercut_cache: tuple[tuple, dict[tuple, UndercutAnalysis]] | None = None
+
     def update_fuel(self, fuel_state: FuelState) -> None:
         """Update current fuel state."""
         # Record consumption if we have previous data
@@ -95,6 +158,7 @@ class StrategyEngine:
             self.fuel_calculator.update_consumption(consumption)
 
         self.fuel_state = fuel_state
+        self._state_version += 1
 
     def update_tires(self, tire_state: TireState) -> None:
         """Update current tire state."""
@@ -103,14 +167,17 @@ class StrategyEngine:
 
         self.tire_state = tire_state
         self.tire_predictor.current_compound = tire_state.compound
+        self._state_version += 1
 
     def update_weather(self, weather: WeatherForecast) -> None:
         """Update weather forecast."""
         self.weather = weather
+        self._state_version += 1
 
     def update_lap(self, lap: int) -> None:
         """Update current lap number."""
         self.current_lap = lap
+        self._state_version += 1
 
     def set_race_info(
         self,
@@ -124,35 +191,80 @@ class StrategyEngine:
         self.race_duration_hours = duration_hours
         self.average_lap_time = average_lap_time
         self.pit_loss_time = pit_loss
-
-    def get_fuel_prediction(self) -> FuelPrediction | None:
-        """Get current fuel prediction."""
-        if not self.fuel_state:
-            return None
-
-        return self.fuel_calculator.predict(
-            self.fuel_state,
+        self._state_version += 1
+
+    def _cache_key(self) -> tuple:
+        """
+        Key of the prediction caches: the state version plus every input
+        that can also be assigned directly, without an update_* call.
+
+        The states are frozen and usually unchanged, so comparing two keys
+        is mostly identity checks.
+        """
+        return (
+            self._state_version,
             self.current_lap,
             self.total_laps,
             self.average_lap_time,
+            self.pit_loss_time,
+            self.fuel_state,
+            self.tire_state,
+            self.fuel_calculator.safety_margin_laps,
         )
 
-    def get_tire_prediction(self) -> TirePrediction | None:
-        """Get current tire prediction."""
-        if not self.tire_state:
-            return None
+    def get_fuel_prediction(self) -> FuelPrediction | None:
+        """
+        Get current fuel prediction.
+
+        Cached until the next update_* / set_race_info call or a change of
+        any input in _cache_key(); record consumption through update_fuel()
+        rather than fuel_calculator.update_consumption().
+        """
+        key = self._cache_key()
+        cached = self._fuel_pred_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        prediction = None
+        if self.fuel_state:
+            prediction = self.fuel_calculator.predict(
+                self.fuel_state,
+                self.current_lap,
+                self.total_laps,
+                self.average_lap_time,
+            )
 
-        fuel_window = None
-        fuel_pred = self.get_fuel_prediction()
-        if fuel_pred:
-            fuel_window = (fuel_pred.pit_window_start, fuel_pred.pit_window_end)
+        self._fuel_pred_cache = (key, prediction)
+        return prediction
 
-        return self.tire_predictor.predict(
-            self.tire_state,
-            self.current_lap,
-            self.total_laps,
-            fuel_window,
-        )
+    def get_tire_prediction(self) -> TirePrediction | None:
+        """
+        Get current tire prediction.
+
+        Cached like get_fuel_prediction(), whose pit window it uses; record
+        wear through update_tires() rather than tire_predictor.update_wear().
+        """
+        key = self._cache_key()
+        cached = self._tire_pred_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        prediction = None
+        if self.tire_state:
+            fuel_window = None
+            fuel_pred = self.get_fuel_prediction()
+            if fuel_pred:
+                fuel_window = (fuel_pred.pit_window_start, fuel_pred.pit_window_end)
+
+            prediction = self.tire_predictor.predict(
+                self.tire_state,
+                self.current_lap,
+                self.total_laps,
+                fuel_window,
+            )
+
+        self._tire_pred_cache = (key, prediction)
+        return prediction
 
     def calculate_optimal_strategy(
         self,
@@ -160,106 +272,162 @@ class StrategyEngine:
         max_stops: int = 10,
         drivers: list[str] | None = None,
     ) -> StrategyPlan:
-        """Calculate optimal pit stop strategy for the race."""
+        """
+        Calculate optimal pit stop strategy for the race.
+
+        Every stop count up to max_stops is evaluated at once: the race is
+        split into even stints, each stint gets the compound suggested for
+        its start lap, and candidates are scored as
+        pit_loss * stops + sum(tire_deg * stint_laps^2), plus an exponential
+        penalty for laps run past each compound's cliff. The cheapest
+        candidate whose stints fit in the tank and the tire life wins.
+        """
         drivers = drivers or ["Driver 1"]
+        total_laps = self.total_laps
+        track_temp = self.weather.track_temp if self.weather else 25.0
+
+        # Candidate stop counts
+        first = min(max(min_stops, 1), max_stops)
+        stops = np.arange(first, max_stops + 1)
+
+        # Stint boundaries, one row per candidate
+        bounds, stint_laps = split_race(stops, total_laps)
+
+        # Compound for each stint: current set, then the suggestion at each stop
+        start_compound = self.tire_state.compound if self.tire_state else TireCompound.MEDIUM
+        pit_laps = bounds[:, 1:-1]
+        compound_idx = np.empty_like(stint_laps)
+        compound_idx[:, 0] = start_compound
+        compound_idx[:, 1:] = self.tire_predictor.suggest_compounds(
+            total_laps - pit_laps, self._weather_indices(pit_laps), track_temp
+        )
 
-        # Calculate number of stops needed
-        if self.fuel_state:
-            fuel_per_lap = self.fuel_calculator.get_average_consumption() or self.fuel_state.consumption_per_lap
-            total_fuel_needed = self.total_laps * fuel_per_lap
-            fuel_stops = max(0, int(total_fuel_needed / self.fuel_state.tank_capacity))
-        else:
-            fuel_stops = 0
+        # Score every candidate
+        cost = score_plans(
+            stops,
+            stint_laps,
+            _TIRE_DEG[compound_idx],
+            _TIRE_CLIFF[compound_idx],
+            self.pit_loss_time,
+        )
 
-        # Consider tire stops
+        longest_stint = stint_laps.max(axis=1)
+        feasible = np.ones(len(stops), dtype=bool)
+        if self.fuel_state:
+            fuel_per_lap = (
+                self.fuel_calculator.get_average_consumption()
+                or self.fuel_state.consumption_per_lap
+            )
+            feasible &= longest_stint * fuel_per_lap <= self.fuel_state.tank_capacity
         if self.tire_state:
             tire_life = self.tire_predictor.predict(
-                self.tire_state, 0, self.total_laps
+                self.tire_state, 0, total_laps
             ).laps_remaining
-            tire_stops = max(0, int(self.total_laps / max(tire_life, 20)) - 1)
-        else:
-            tire_stops = 0
+            feasible &= longest_stint <= (tire_life if tire_life > 20 else 20)
 
-        num_stops = max(min_stops, fuel_stops, tire_stops, 1)
-        num_stops = min(num_stops, max_stops)
+        # Nothing fits: fall back to the most stops allowed
+        best = int(np.argmin(np.where(feasible, cost, np.inf))) if feasible.any() else -1
+        num_stops = int(stops[best])
 
-        # Calculate stint lengths
-        laps_per_stint = self.total_laps // (num_stops + 1)
-
-        # Build strategy plan
+        # Materialize the winner only
         plan = StrategyPlan(
-            race_laps=self.total_laps,
+            race_laps=total_laps,
             race_duration=self.race_duration_hours,
             drivers=drivers,
             min_pit_stops=min_stops,
         )
 
-        # Generate pit stops and stints
-        current_lap = 0
-        for i in range(num_stops):
-            pit_lap = current_lap + laps_per_stint
-
-            # Determine tire compound for next stint
-            remaining = self.total_laps - pit_lap
-            weather_at_pit = WeatherCondition.DRY
-            if self.weather:
-                weather_at_pit = self.weather.get_condition_at_lap(pit_lap)
-
-            compound = self.tire_predictor.suggest_compound(
-                remaining,
-                weather_at_pit,
-                self.weather.track_temp if self.weather else 25.0,
-            )
+        # The winning row stays columnar until the dataclasses are built
+        best_bounds = bounds[best, :num_stops + 2]
+        best_laps = stint_laps[best, :num_stops + 1]
+        best_compounds = [COMPOUNDS[i] for i in compound_idx[best, :num_stops + 1].tolist()]
 
-            # Calculate fuel to add
-            fuel_to_add = 0.0
-            if self.fuel_state:
-                laps_to_next = laps_per_stint if i < num_stops - 1 else self.total_laps - pit_lap
-                fuel_to_add = self.fuel_calculator.calculate_fuel_for_laps(
-                    laps_to_next,
-                    self.fuel_state,
-                )
+        if self.fuel_state:
+            fuel_to_add = self.fuel_calculator.calculate_fuel_for_laps(
+                best_laps[1:],
+                self.fuel_state,
+            ).tolist()
+        else:
+            fuel_to_add = [0.0] * num_stops
 
-            pit_stop = PitStop(
-                lap=pit_lap,
+        # Stint bounds are increasing, so the stops are already in lap order
+        plan.pit_stops.extend(
+            PitStop(
+                lap=lap,
                 stop_type=PitStopType.FUEL_AND_TIRES,
-                fuel_to_add=fuel_to_add,
+                fuel_to_add=fuel,
                 tire_compound=compound,
                 estimated_duration=self.pit_loss_time,
             )
-            plan.pit_stops.append(pit_stop)
+            for lap, fuel, compound in zip(
+                best_bounds[1:-1].tolist(), fuel_to_add, best_compounds[1:]
+            )
+        )
 
-            # Create stint
-            stint = Stint(
+        starts = best_bounds[:-1].tolist()
+        ends = best_bounds[1:].tolist()
+        for i in range(num_stops + 1):
+            plan.stints.append(Stint(
                 stint_number=i + 1,
                 driver=drivers[i % len(drivers)],
-                start_lap=current_lap,
-                end_lap=pit_lap,
-                tire_compound=self.tire_state.compound if self.tire_state else TireCompound.MEDIUM,
-            )
-            plan.stints.append(stint)
-
-            current_lap = pit_lap
-
-        # Final stint
-        final_stint = Stint(
-            stint_number=num_stops + 1,
-            driver=drivers[num_stops % len(drivers)],
-            start_lap=current_lap,
-            end_lap=self.total_laps,
-        )
-        plan.stints.append(final_stint)
+                start_lap=starts[i],
+                end_lap=ends[i],
+                tire_compound=best_compounds[i],
+            ))
 
         self.strategy_plan = plan
+        self._state_version += 1
         return plan
 
+    def _weather_indices(self, laps: np.ndarray) -> np.ndarray:
+        """WEATHER_CONDITIONS index of the forecast condition at each lap."""
+        weather = self.weather
+        if not weather:
+            return np.full(laps.shape, WEATHER_CONDITIONS.index(WeatherCondition.DRY))
+
+        changes = weather.forecast_changes
+        change_laps = np.array([lap for lap, _ in changes], dtype=np.intp)
+        conditions = np.array(
+            [WEATHER_CONDITIONS.index(weather.current_condition)]
+            + [WEATHER_CONDITIONS.index(cond) for _, cond in changes]
+        )
+        return conditions[np.searchsorted(change_laps, laps, side="right")]
+
     def analyze_undercut(
         self,
         target_driver: str,
         gap_to_target: float,
         target_tire_age: int = 0,
     ) -> UndercutAnalysis:
-        """Analyze undercut opportunity against a target driver."""
+        """
+        Analyze undercut opportunity against a target driver.
+
+        Results are cached like the predictions, so polling the same
+        competitors between updates is a dict lookup. A live gap changes on
+        every poll, so at most UNDERCUT_CACHE_SIZE results are kept, the
+        oldest evicted first.
+        """
+        cache_key = self._cache_key()
+        cached = self._undercut_cache
+        if cached is None or cached[0] != cache_key:
+            cached = self._undercut_cache = (cache_key, {})
+
+        entries = cached[1]
+        key = (target_driver, gap_to_target, target_tire_age)
+        analysis = entries.get(key)
+        if analysis is None:
+            analysis = self._analyze_undercut(target_driver, gap_to_target, target_tire_age)
+            if len(entries) >= self.UNDERCUT_CACHE_SIZE:
+                del entries[next(iter(entries))]
+            entries[key] = analysis
+        return analysis
+
+    def _analyze_undercut(
+        self,
+        target_driver: str,
+        gap_to_target: float,
+        target_tire_age: int,
+    ) -> UndercutAnalysis:
         # Undercut works best when:
         # 1. Gap is within pit loss window
         # 2. Target has older tires
@@ -279,7 +447,8 @@ class StrategyEngine:
                 # Target has older tires
                 can_undercut = True
                 # Fresh tire advantage ~0.5s per lap
-                laps_until_target_pits = max(1, target_tire_age - 30)  # Assume they pit soon
+                # Assume they pit soon
+                laps_until_target_pits = target_tire_age - 30 if target_tire_age > 31 else 1
                 potential_gain = 0.5 * laps_until_target_pits
                 risk = "low" if potential_gain > gap_to_target else "medium"
 
@@ -287,8 +456,10 @@ class StrategyEngine:
         window_end = self.current_lap + 5
 
         if fuel_pred:
-            window_start = max(window_start, fuel_pred.pit_window_start)
-            window_end = min(window_end, fuel_pred.pit_window_end)
+            if fuel_pred.pit_window_start > window_start:
+                window_start = fuel_pred.pit_window_start
+            if fuel_pred.pit_window_end < window_end:
+                window_end = fuel_pred.pit_window_end
 
         return UndercutAnalysis(
             target_driver=target_driver,
@@ -301,10 +472,19 @@ class StrategyEngine:
 
     def get_recommendations(self) -> list[StrategyRecommendation]:
         """Get current strategy recommendations."""
+        return self._recommend(self.get_fuel_prediction(), self.get_tire_prediction())
+
+    def _recommend(
+        self,
+        fuel_pred: FuelPrediction | None,
+        tire_pred: TirePrediction | None,
+    ) -> list[StrategyRecommendation]:
+        """Build recommendations from predictions the caller already has."""
         recommendations = []
 
-        fuel_pred = self.get_fuel_prediction()
-        tire_pred = self.get_tire_prediction()
+        weather = self.weather
+        track_temp = weather.track_temp if weather else 25.0
+        condition = weather.current_condition if weather else WeatherCondition.DRY
 
         # Critical fuel warning
         if fuel_pred and fuel_pred.is_critical:
@@ -331,20 +511,20 @@ class StrategyEngine:
                     stop_type=PitStopType.TIRES_ONLY,
                     tire_compound=self.tire_predictor.suggest_compound(
                         self.total_laps - self.current_lap,
-                        self.weather.current_condition if self.weather else WeatherCondition.DRY,
-                        self.weather.track_temp if self.weather else 25.0,
+                        condition,
+                        track_temp,
                     ),
                 ),
                 details={"tire_wear": self.tire_state.average_wear}
             ))
 
         # Weather change incoming
-        if self.weather and self.weather.rain_probability > 0.7:
+        if weather and weather.rain_probability > 0.7:
             recommendations.append(StrategyRecommendation(
                 action="prepare_wet",
                 priority=2,
                 reason="Pluie probable - preparer pneus pluie",
-                details={"rain_probability": self.weather.rain_probability}
+                details={"rain_probability": weather.rain_probability}
             ))
 
         # Optimal pit window
@@ -355,8 +535,8 @@ class StrategyEngine:
             if in_fuel_window and near_tire_optimal:
                 compound = self.tire_predictor.suggest_compound(
                     self.total_laps - self.current_lap,
-                    self.weather.current_condition if self.weather else WeatherCondition.DRY,
-                    self.weather.track_temp if self.weather else 25.0,
+                    condition,
+                    track_temp,
                 )
 
                 recommendations.append(StrategyRecommendation(
@@ -387,18 +567,40 @@ class StrategyEngine:
                 }
             ))
 
-        return sorted(recommendations, key=lambda r: r.priority)
+        recommendations.sort(key=_PRIORITY_KEY)
+        return recommendations
 
     def to_dict(self) -> dict[str, Any]:
-        """Export current state as dictionary."""
+        """
+        Export current state as dictionary.
+
+        The fuel, tire and prediction sections are cached until the next
+        update_* / set_race_info / calculate_optimal_strategy call and are
+        shared between results, so treat them as read-only. The weather,
+        strategy plan and recommendations can change in place and are
+        rebuilt on every call.
+        """
+        cache_key = self._cache_key()
+        cached = self._dict_cache
+        if cached is None or cached[0] != cache_key:
+            fuel_pred = self.get_fuel_prediction()
+            tire_pred = self.get_tire_prediction()
+            cached = self._dict_cache = (cache_key, {
+                "fuel": self.fuel_state.to_dict() if self.fuel_state else None,
+                "tires": self.tire_state.to_dict() if self.tire_state else None,
+                "fuel_prediction": fuel_pred.to_dict() if fuel_pred else None,
+                "tire_prediction": tire_pred.to_dict() if tire_pred else None,
+            })
+        sections = cached[1]
+
         return {
             "current_lap": self.current_lap,
             "total_laps": self.total_laps,
-            "fuel": self.fuel_state.to_dict() if self.fuel_state else None,
-            "tires": self.tire_state.to_dict() if self.tire_state else None,
+            "fuel": sections["fuel"],
+            "tires": sections["tires"],
             "weather": self.weather.to_dict() if self.weather else None,
-            "fuel_prediction": self.get_fuel_prediction().to_dict() if self.get_fuel_prediction() else None,
-            "tire_prediction": self.get_tire_prediction().to_dict() if self.get_tire_prediction() else None,
+            "fuel_prediction": sections["fuel_prediction"],
+            "tire_prediction": sections["tire_prediction"],
             "strategy_plan": self.strategy_plan.to_dict() if self.strategy_plan else None,
             "recommendations": [r.to_dict() for r in self.get_recommendations()],
         }
@@ -0,0 +1,44 @@
+"""Array kernels behind StrategyEngine.calculate_optimal_strategy"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def split_race(stops: np.ndarray, total_laps: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split the race into even stints for every candidate stop count.
+
+    Returns (bounds, stint_laps). Row k of bounds is 0, the pit laps, then
+    total_laps, padded with total_laps up to stops.max() + 2 columns, so
+    unused columns of stint_laps are zero-length stints.
+    """
+    cols = np.arange(int(stops.max()) + 2)
+    bounds = np.minimum((cols * total_laps) // (stops[:, None] + 1), total_laps)
+    return bounds, np.diff(bounds, axis=1)
+
+
+# Past the cliff, lap time loss starts at CLIFF_LOSS seconds and grows by
+# a factor of exp(CLIFF_GROWTH) every lap
+CLIFF_LOSS = 0.5
+CLIFF_GROWTH = 0.25
+
+
+def score_plans(
+    stops: np.ndarray,
+    stint_laps: np.ndarray,
+    stint_deg: np.ndarray,
+    stint_cliff: np.ndarray,
+    pit_loss: float,
+) -> np.ndarray:
+    """
+    Time cost of each candidate plan (seconds).
+
+    pit_loss per stop plus tire_deg * stint_laps^2 per stint, where
+    stint_deg is the lap time lost per lap of tire age for each stint,
+    plus an exponential penalty for the laps each stint runs past its
+    compound's cliff (stint_cliff, in laps).
+    """
+    over = np.maximum(stint_laps - stint_cliff, 0)
+    cliff = CLIFF_LOSS * np.expm1(CLIFF_GROWTH * over) / CLIFF_GROWTH
+    return pit_loss * stops + (stint_deg * stint_laps**2 + cliff).sum(axis=1)
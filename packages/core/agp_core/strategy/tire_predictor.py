@@ -1,13 +1,34 @@
 """Tire degradation prediction for race strategy"""
 
 from __future__ import annotations
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 from agp_core.strategy.models import TireState, TireCompound, WeatherCondition
 
 
-@dataclass
+# Fixed recommendation texts, shared by every prediction
+_REC_CRITICAL = "CRITIQUE: Pneus uses, pit immediat recommande"
+_REC_DEGRADED = "Pneus degrades, preparer le pit stop"
+
+
+def _recommendation(average_wear: float, laps_to_pit: int, optimal_pit: int) -> str:
+    """Recommendation text for a tire prediction."""
+    if average_wear < 30:
+        return _REC_CRITICAL
+    elif average_wear < 50:
+        return _REC_DEGRADED
+    elif laps_to_pit <= 3:
+        return f"Fenetre de pit dans {laps_to_pit} tours"
+    else:
+        return f"Pneus OK, prochain pit tour ~{optimal_pit}"
+
+
+@dataclass(frozen=True, slots=True)
 class TirePrediction:
     """Tire life prediction result."""
     laps_remaining: int
@@ -27,6 +48,17 @@ class TirePrediction:
             "recommendation": self.recommendation,
         }
 
+    def to_tuple(self) -> tuple[int, int, float, float, float, str]:
+        """Field values in declaration order, for compact serializers."""
+        return (
+            self.laps_remaining,
+            self.optimal_pit_lap,
+            self.grip_at_pit,
+            self.lap_time_loss,
+            self.wear_rate,
+            self.recommendation,
+        )
+
 
 class TirePredictor:
     """Predictor for tire degradation and optimal pit timing."""
@@ -56,50 +88,86 @@ class TirePredictor:
     # Lap time loss per grip % lost (seconds)
     TIME_LOSS_PER_GRIP_PERCENT = 0.03
 
+    # Grip multiplier below which the tires should be changed
+    TARGET_GRIP = 0.85
+
+    HISTORY_SIZE = 30  # Wear samples kept for the wear rate
+
     def __init__(self):
-        self.wear_history: list[tuple[int, float]] = []  # (lap, wear)
+        # Ring buffers of (lap, wear) samples, the newest at _head - 1
+        self._lap_buf = np.zeros(self.HISTORY_SIZE, dtype=np.int32)
+        self._wear_buf = np.zeros(self.HISTORY_SIZE, dtype=np.float64)
+        self._head: int = 0
+        self._count: int = 0
         self.current_compound: TireCompound = TireCompound.MEDIUM
 
+    @property
+    def wear_history(self) -> list[tuple[int, float]]:
+        """
+        Recorded (lap, wear) samples, oldest first.
+
+        Returns a copy: record samples with update_wear(), or assign a new
+        list to replace the history (only the last HISTORY_SIZE samples are
+        kept).
+        """
+        idx = (self._head - self._count + np.arange(self._count)) % self.HISTORY_SIZE
+        return list(zip(self._lap_buf[idx].tolist(), self._wear_buf[idx].tolist()))
+
+    @wear_history.setter
+    def wear_history(self, history: Sequence[tuple[int, float]]) -> None:
+        samples = list(history)[-self.HISTORY_SIZE:]
+        self._head = self._count = 0
+        for lap, wear in samples:
+            self.update_wear(lap, wear)
+
     def update_wear(self, lap: int, average_wear: float) -> None:
         """Record tire wear for a lap."""
-        self.wear_history.append((lap, average_wear))
-        # Keep last 30 data points
-        self.wear_history = self.wear_history[-30:]
+        head = self._head
+        self._lap_buf[head] = lap
+        self._wear_buf[head] = average_wear
+        self._head = (head + 1) % self.HISTORY_SIZE
+        if self._count < self.HISTORY_SIZE:
+            self._count += 1
 
     def get_wear_rate(self, tire_state: TireState) -> float:
         """Calculate actual wear rate from history or use defaults."""
-        if len(self.wear_history) < 3:
-            return self.DEGRADATION_RATES.get(tire_state.compound, 1.8)
+        default_rate = _DEG_BY_VALUE.get(tire_state.compound, 1.8)
+        if self._count < 3:
+            return default_rate
 
-        # Calculate from recent history
-        recent = self.wear_history[-5:]
-        if len(recent) < 2:
-            return self.DEGRADATION_RATES.get(tire_state.compound, 1.8)
+        # Calculate from recent history (last 5 points)
+        first = (self._head - min(self._count, 5)) % self.HISTORY_SIZE
+        last = (self._head - 1) % self.HISTORY_SIZE
 
-        total_wear = recent[0][1] - recent[-1][1]
-        total_laps = recent[-1][0] - recent[0][0]
+        total_wear = float(self._wear_buf[first] - self._wear_buf[last])
+        total_laps = int(self._lap_buf[last] - self._lap_buf[first])
 
         if total_laps <= 0:
-            return self.DEGRADATION_RATES.get(tire_state.compound, 1.8)
+            return default_rate
 
         return abs(total_wear / total_laps)
 
     def get_grip_for_wear(self, wear_percent: float) -> float:
         """Get grip multiplier for a given wear level."""
-        for i, (wear, grip) in enumerate(self.GRIP_CURVE):
-            if wear_percent >= wear:
-                if i == 0:
-                    return grip
-                # Interpolate
-                prev_wear, prev_grip = self.GRIP_CURVE[i - 1]
-                ratio = (prev_wear - wear_percent) / (prev_wear - wear)
-                return prev_grip - (prev_grip - grip) * ratio
+        if wear_percent >= 100.0:
+            return _GRIP_TABLE[-1]
+        if not wear_percent > 0.0:
+            return _GRIP_TABLE[0]
 
-        return 0.60  # Below minimum
+        x = wear_percent * _GRIP_TABLE_RES
+        i = int(x)
+        grip = _GRIP_TABLE[i]
+        return grip + (_GRIP_TABLE[i + 1] - grip) * (x - i)
 
-    def predict_wear_at_lap(self, tire_state: TireState, laps_ahead: int) -> float:
+    def predict_wear_at_lap(
+        self,
+        tire_state: TireState,
+        laps_ahead: int,
+        wear_rate: float | None = None,
+    ) -> float:
         """Predict wear level at a future lap."""
-        wear_rate = self.get_wear_rate(tire_state)
+        if wear_rate is None:
+            wear_rate = self.get_wear_rate(tire_state)
         predicted_wear = tire_state.average_wear - (wear_rate * laps_ahead)
         return max(0, predicted_wear)
 
@@ -109,26 +177,26 @@ class TirePredictor:
         current_lap: int,
         total_laps: int,
         fuel_pit_window: tuple[int, int] | None = None,
+        wear_rate: float | None = None,
     ) -> int:
         """Calculate optimal lap to pit based on tire degradation."""
-        wear_rate = self.get_wear_rate(tire_state)
-
-        # Find lap where grip drops below acceptable level (85%)
-        target_grip = 0.85
-        laps_to_target = 0
-
-        for lap_offset in range(1, total_laps - current_lap + 1):
-            predicted_wear = tire_state.average_wear - (wear_rate * lap_offset)
-            grip = self.get_grip_for_wear(predicted_wear)
-
-            if grip < target_grip:
-                laps_to_target = lap_offset
-                break
-            laps_to_target = lap_offset
-
-        optimal_lap = current_lap + laps_to_target
+        if wear_rate is None:
+            wear_rate = self.get_wear_rate(tire_state)
+        laps_to_target = _laps_to_target_wear(
+            tire_state.average_wear,
+            wear_rate,
+            total_laps - current_lap,
+            _TARGET_WEAR,
+        )
+        return self._fit_fuel_window(current_lap + laps_to_target, total_laps, fuel_pit_window)
 
-        # Consider fuel window if provided
+    def _fit_fuel_window(
+        self,
+        optimal_lap: int,
+        total_laps: int,
+        fuel_pit_window: tuple[int, int] | None,
+    ) -> int:
+        """Move the tire-optimal pit lap into the fuel window, if provided."""
         if fuel_pit_window:
             fuel_start, fuel_end = fuel_pit_window
             # Prefer to pit when both fuel and tires align
@@ -143,20 +211,18 @@ class TirePredictor:
 
         return min(optimal_lap, total_laps - 1)
 
-    def calculate_time_loss(self, tire_state: TireState, laps: int) -> float:
+    def calculate_time_loss(
+        self,
+        tire_state: TireState,
+        laps: int,
+        wear_rate: float | None = None,
+    ) -> float:
         """Calculate cumulative lap time loss over given laps."""
-        total_loss = 0.0
-        wear_rate = self.get_wear_rate(tire_state)
-        current_wear = tire_state.average_wear
-
-        for lap in range(laps):
-            grip = self.get_grip_for_wear(current_wear)
-            grip_loss = 1.0 - grip
-            lap_loss = grip_loss * 100 * self.TIME_LOSS_PER_GRIP_PERCENT
-            total_loss += lap_loss
-            current_wear -= wear_rate
-
-        return total_loss
+        if wear_rate is None:
+            wear_rate = self.get_wear_rate(tire_state)
+        wears = tire_state.average_wear - wear_rate * np.arange(laps)
+        grips = np.interp(wears, _CURVE_WEAR_XP, _CURVE_GRIP_FP, left=0.60)
+        return float(((1.0 - grips) * 100 * self.TIME_LOSS_PER_GRIP_PERCENT).sum())
 
     def predict(
         self,
@@ -175,26 +241,16 @@ class TirePredictor:
 
         # Calculate optimal pit lap
         optimal_pit = self.calculate_optimal_pit_lap(
-            tire_state, current_lap, total_laps, fuel_pit_window
+            tire_state, current_lap, total_laps, fuel_pit_window, wear_rate
         )
 
         # Grip at optimal pit lap
         laps_to_pit = optimal_pit - current_lap
-        wear_at_pit = self.predict_wear_at_lap(tire_state, laps_to_pit)
+        wear_at_pit = self.predict_wear_at_lap(tire_state, laps_to_pit, wear_rate)
         grip_at_pit = self.get_grip_for_wear(wear_at_pit) * 100
 
         # Time loss calculation
-        time_loss = self.calculate_time_loss(tire_state, laps_to_pit)
-
-        # Generate recommendation
-        if tire_state.average_wear < 30:
-            recommendation = "CRITIQUE: Pneus uses, pit immediat recommande"
-        elif tire_state.average_wear < 50:
-            recommendation = "Pneus degrades, preparer le pit stop"
-        elif laps_to_pit <= 3:
-            recommendation = f"Fenetre de pit dans {laps_to_pit} tours"
-        else:
-            recommendation = f"Pneus OK, prochain pit tour ~{optimal_pit}"
+        time_loss = self.calculate_time_loss(tire_state, laps_to_pit, wear_rate)
 
         return TirePrediction(
             laps_remaining=laps_remaining,
@@ -202,9 +258,79 @@ class TirePredictor:
             grip_at_pit=grip_at_pit,
             lap_time_loss=time_loss,
             wear_rate=wear_rate,
-            recommendation=recommendation,
+            recommendation=_recommendation(tire_state.average_wear, laps_to_pit, optimal_pit),
         )
 
+    def predict_batch(
+        self,
+        tire_states: Sequence[TireState],
+        current_lap: int,
+        total_laps: int,
+        wear_rates: Sequence[float] | None = None,
+    ) -> list[TirePrediction]:
+        """
+        Predict several tire sets (e.g. every car in the field) at once.
+
+        Same result as predict() without a fuel window for each state, but
+        computed in one array pass. wear_rates defaults to get_wear_rate()
+        for each state.
+        """
+        if not tire_states:
+            return []
+
+        average_wear = np.array([state.average_wear for state in tire_states])
+        if wear_rates is None:
+            wear_rates = [self.get_wear_rate(state) for state in tire_states]
+        wear_rate = np.asarray(wear_rates, dtype=np.float64)
+        race_laps = total_laps - current_lap
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Calculate laps until cliff (20% wear)
+            laps_to_cliff = np.where(
+                wear_rate > 0,
+                np.maximum(0, np.trunc((average_wear - 20.0) / wear_rate)),
+                race_laps,
+            )
+            laps_remaining = np.minimum(laps_to_cliff, race_laps).astype(np.intp)
+
+            # Calculate optimal pit lap
+            laps_to_target = _laps_to_target_wear_batch(
+                average_wear, wear_rate, race_laps, _TARGET_WEAR
+            )
+        optimal_pit = np.minimum(current_lap + laps_to_target, total_laps - 1)
+        laps_to_pit = optimal_pit - current_lap
+
+        # Grip at optimal pit lap
+        wear_at_pit = np.maximum(0, average_wear - wear_rate * laps_to_pit)
+        grip_at_pit = np.interp(wear_at_pit, _CURVE_WEAR_XP, _CURVE_GRIP_FP, left=0.60) * 100
+
+        # Time loss up to each set's pit lap: one row per set, masked past it
+        offsets = np.arange(max(int(laps_to_pit.max()), 0))
+        wears = average_wear[:, None] - wear_rate[:, None] * offsets
+        grips = np.interp(wears, _CURVE_WEAR_XP, _CURVE_GRIP_FP, left=0.60)
+        lap_loss = (1.0 - grips) * 100 * self.TIME_LOSS_PER_GRIP_PERCENT
+        time_loss = (lap_loss * (offsets < laps_to_pit[:, None])).sum(axis=1)
+
+        return [
+            TirePrediction(
+                laps_remaining=remaining,
+                optimal_pit_lap=pit,
+                grip_at_pit=grip,
+                lap_time_loss=loss,
+                wear_rate=rate,
+                recommendation=_recommendation(wear, to_pit, pit),
+            )
+            for remaining, pit, grip, loss, rate, wear, to_pit in zip(
+                laps_remaining.tolist(),
+                optimal_pit.tolist(),
+                grip_at_pit.tolist(),
+                time_loss.tolist(),
+                wear_rate.tolist(),
+                average_wear.tolist(),
+                laps_to_pit.tolist(),
+            )
+        ]
+
     def suggest_compound(
         self,
         laps_remaining: int,
@@ -212,20 +338,134 @@ class TirePredictor:
         track_temp: float,
     ) -> TireCompound:
         """Suggest tire compound for next stint."""
-        # Wet conditions
-        if weather == WeatherCondition.HEAVY_RAIN:
-            return TireCompound.WET
-        if weather == WeatherCondition.LIGHT_RAIN:
-            return TireCompound.INTERMEDIATE
-
-        # Dry conditions - based on stint length and track temp
-        if laps_remaining <= 15:
-            return TireCompound.SOFT
-        elif laps_remaining <= 30:
-            if track_temp > 35:
-                return TireCompound.HARD
-            return TireCompound.MEDIUM
-        else:
-            if track_temp > 30:
-                return TireCompound.HARD
-            return TireCompound.MEDIUM
+        temp_bucket = (track_temp > 30) + (track_temp > 35)
+        remaining_bucket = (laps_remaining > 15) + (laps_remaining > 30)
+        return COMPOUNDS[_COMPOUND_TABLE[_WEATHER_INDEX[weather], temp_bucket, remaining_bucket]]
+
+    def suggest_compounds(
+        self,
+        laps_remaining: np.ndarray,
+        weather_idx: np.ndarray,
+        track_temp: float,
+    ) -> np.ndarray:
+        """
+        Vectorized suggest_compound.
+
+        Takes arrays of laps remaining and WEATHER_CONDITIONS indices and
+        returns COMPOUNDS indices, looked up in a precomputed table.
+        """
+        temp_bucket = int(track_temp > 30) + int(track_temp > 35)
+        remaining_bucket = (laps_remaining > 15).astype(np.intp) + (laps_remaining > 30)
+        return _COMPOUND_TABLE[weather_idx, temp_bucket, remaining_bucket]
+
+
+# DEGRADATION_RATES keyed by plain int. TireCompound is an IntEnum, so
+# members still hit these keys, but hash and compare as ints.
+_DEG_BY_VALUE: dict[int, float] = {
+    compound.value: rate for compound, rate in TirePredictor.DEGRADATION_RATES.items()
+}
+
+
+# GRIP_CURVE in ascending wear order, for bisect and np.interp
+_CURVE_WEARS: tuple[float, ...] = tuple(wear for wear, _ in reversed(TirePredictor.GRIP_CURVE))
+_CURVE_GRIPS: tuple[float, ...] = tuple(grip for _, grip in reversed(TirePredictor.GRIP_CURVE))
+
+_CURVE_WEAR_XP = np.array(_CURVE_WEARS, dtype=np.float64)
+_CURVE_GRIP_FP = np.array(_CURVE_GRIPS, dtype=np.float64)
+
+# Wear at which grip reaches TARGET_GRIP; grip rises with wear along the
+# curve, so grip < TARGET_GRIP exactly when wear < _TARGET_WEAR
+_TARGET_WEAR = float(np.interp(TirePredictor.TARGET_GRIP, _CURVE_GRIP_FP, _CURVE_WEAR_XP))
+
+
+def _laps_to_target_wear(
+    average_wear: float,
+    wear_rate: float,
+    laps: int,
+    target_wear: float,
+) -> int:
+    """
+    First lap offset in 1..laps at which wear drops below target_wear.
+
+    Wear falls linearly, so this is closed form instead of a per-lap scan.
+    Returns laps if it never does within the race, 0 if laps <= 0.
+    """
+    if laps <= 0:
+        return 0
+    if average_wear < target_wear:
+        return 1
+    if wear_rate <= 0:
+        return laps
+    offset = int((average_wear - target_wear) / wear_rate) + 1
+    # The division can land a hair either side of a whole lap; settle the
+    # boundary with the same expression the wear trajectory uses
+    if average_wear - wear_rate * offset >= target_wear:
+        offset += 1
+    elif offset > 1 and average_wear - wear_rate * (offset - 1) < target_wear:
+        offset -= 1
+    return offset if offset < laps else laps
+
+
+def _laps_to_target_wear_batch(
+    average_wear: np.ndarray,
+    wear_rate: np.ndarray,
+    laps: int,
+    target_wear: float,
+) -> np.ndarray:
+    """Array version of _laps_to_target_wear, one entry per tire set."""
+    offset = np.trunc((average_wear - target_wear) / wear_rate) + 1
+    offset += average_wear - wear_rate * offset >= target_wear
+    offset -= (offset > 1) & (average_wear - wear_rate * (offset - 1) < target_wear)
+    offset = np.where(wear_rate <= 0, laps, np.minimum(offset, laps))
+    offset = np.where(average_wear < target_wear, 1, offset)
+    return np.zeros(len(offset), dtype=np.intp) if laps <= 0 else offset.astype(np.intp)
+
+
+def _interp_grip_curve(wear_percent: float) -> float:
+    """Piecewise-linear GRIP_CURVE lookup, 0.60 below the curve."""
+    if wear_percent >= _CURVE_WEARS[-1]:
+        return _CURVE_GRIPS[-1]
+    if not wear_percent >= _CURVE_WEARS[0]:
+        return 0.60  # Below minimum
+
+    # Interpolate between the breakpoints either side
+    i = bisect_right(_CURVE_WEARS, wear_percent)
+    prev_wear = _CURVE_WEARS[i]
+    prev_grip = _CURVE_GRIPS[i]
+    ratio = (prev_wear - wear_percent) / (prev_wear - _CURVE_WEARS[i - 1])
+    return prev_grip - (prev_grip - _CURVE_GRIPS[i - 1]) * ratio
+
+
+# Grip sampled every 0.1% wear over 0-100. The curve is linear between
+# its 10%-spaced breakpoints, so interpolating in this table reproduces it.
+_GRIP_TABLE_RES = 10.0  # entries per % of wear
+_GRIP_TABLE = array("d", (_interp_grip_curve(i / _GRIP_TABLE_RES) for i in range(1001)))
+
+
+# Index order used by the vectorized helpers (COMPOUNDS[i] has value i)
+COMPOUNDS: tuple[TireCompound, ...] = tuple(TireCompound)
+WEATHER_CONDITIONS: tuple[WeatherCondition, ...] = tuple(WeatherCondition)
+
+
+_WEATHER_INDEX = {weather: i for i, weather in enumerate(WEATHER_CONDITIONS)}
+
+
+def _build_compound_table() -> np.ndarray:
+    """Compound to fit, as [weather, temp_bucket, remaining_bucket]."""
+    # Dry conditions - based on stint length and track temp. Rows are track
+    # temp <= 30, (30, 35], > 35; columns are laps remaining <= 15,
+    # (15, 30], > 30.
+    dry = np.array([
+        [TireCompound.SOFT, TireCompound.MEDIUM, TireCompound.MEDIUM],
+        [TireCompound.SOFT, TireCompound.MEDIUM, TireCompound.HARD],
+        [TireCompound.SOFT, TireCompound.HARD, TireCompound.HARD],
+    ], dtype=np.intp)
+    table = np.repeat(dry[np.newaxis], len(WEATHER_CONDITIONS), axis=0)
+
+    # Wet conditions
+    table[_WEATHER_INDEX[WeatherCondition.HEAVY_RAIN]] = TireCompound.WET
+    table[_WEATHER_INDEX[WeatherCondition.LIGHT_RAIN]] = TireCompound.INTERMEDIATE
+    return table
+
+
+_COMPOUND_TABLE = _build_compound_table()
@@ -1,5 +1,11 @@
 """Telemetry module - rF2 Shared Memory reader and data classes"""
 
-from .rf2_shared_memory import RF2SharedMemory, TelemetryData, ScoringData, WheelData
+from .rf2_shared_memory import (
+    RF2SharedMemory,
+    ScoringData,
+    TelemetryData,
+    TelemetrySection,
+    WheelData,
+)
 
-__all__ = ["RF2SharedMemory", "TelemetryData", "ScoringData", "WheelData"]
+__all__ = ["RF2SharedMemory", "TelemetryData", "TelemetrySection", "ScoringData", "WheelData"]
@@ -5,12 +5,18 @@ Based on rF2 Shared Memory Plugin structures
 """
 
 import ctypes
+import math
 import mmap
 import struct
+import sys
 from ctypes import wintypes
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Dict, Any
+import threading
 import time
+from enum import IntFlag
+
+import numpy as np
 
 # Windows API
 kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
@@ -352,9 +358,197 @@ class rF2ForceFeedback(ctypes.Structure):
     ]
 
 
+# ============= PRECOMPUTED LAYOUTS =============
+
+def _field_layout(struct_type, path: str):
+    """(offset, ctype) of a field, nested fields given as 'mPos.x'"""
+    offset = 0
+    for name in path.split('.'):
+        offset += getattr(struct_type, name).offset
+        struct_type = dict(struct_type._fields_)[name]
+    return offset, struct_type
+
+
+def _field_struct(struct_type, paths, stride: bool = False) -> struct.Struct:
+    """
+    struct.Struct unpacking the given fields of a ctypes Structure in one call.
+
+    paths must be in layout order; the bytes between them are skipped as padding.
+    Char arrays unpack as one fixed-width bytes value, other arrays as their
+    elements. With stride=True the format is padded to the full structure size,
+    so iter_unpack can walk an array of them.
+    """
+    fmt = ['<']
+    pos = 0
+    for path in paths:
+        offset, ctype = _field_layout(struct_type, path)
+        if offset < pos:
+            raise ValueError(f"{path} is out of layout order")
+        if offset > pos:
+            fmt.append(f'{offset - pos}x')
+        if not issubclass(ctype, ctypes.Array):
+            fmt.append(ctype._type_)
+        elif ctype._type_ is ctypes.c_char:
+            fmt.append(f'{ctype._length_}s')
+        else:
+            fmt.append(f'{ctype._length_}{ctype._type_._type_}')
+        pos = offset + ctypes.sizeof(ctype)
+    if stride and pos < ctypes.sizeof(struct_type):
+        fmt.append(f'{ctypes.sizeof(struct_type) - pos}x')
+    return struct.Struct(''.join(fmt))
+
+
+def _field_dtype(struct_type, fields: Dict[str, str]) -> np.dtype:
+    """
+    Structured dtype over whole struct_type records exposing some scalar fields.
+
+    fields maps the column name to the field path; the itemsize is the full
+    structure size, so np.frombuffer can walk an array of them.
+    """
+    names, formats, offsets = [], [], []
+    for name, path in fields.items():
+        offset, ctype = _field_layout(struct_type, path)
+        names.append(name)
+        formats.append(np.dtype(ctype).newbyteorder('<'))
+        offsets.append(offset)
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': ctypes.sizeof(struct_type)})
+
+
+# Every map starts with the two update counters
+VERSION_BEGIN_OFFSET = rF2Telemetry.mVersionUpdateBegin.offset
+VERSION_END_OFFSET = rF2Telemetry.mVersionUpdateEnd.offset
+VERSION_COUNTERS = _field_struct(rF2Telemetry, ['mVersionUpdateBegin', 'mVersionUpdateEnd'])
+CONSISTENT_READ_RETRIES = 8
+UPDATE_SPIN_COUNT = 200      # Counter checks in wait_for_update() before sleeping
+UPDATE_MIN_SLEEP = 0.0005    # First sleep after the spin, doubled while idle...
+UPDATE_MAX_SLEEP = 0.004     # ...up to this
+REFRESH_IDLE_TIMEOUT = 0.05  # Refresh thread re-reads at least this often while paused
+REFRESH_MAX_SLEEP = 0.002    # Backoff cap of the refresh thread's wait
+DECODE_CACHE_SIZE = 512  # Names of a full grid: driver, vehicle and class for 128 cars
+
+TELEMETRY_HEADER = _field_struct(
+    rF2Telemetry, ['mVersionUpdateBegin', 'mVersionUpdateEnd', 'mNumVehicles'])
+
+# Player vehicle fields used by read_telemetry (first vehicle in the array),
+# one struct per TelemetrySection
+PLAYER_TELEMETRY_OFFSET = rF2Telemetry.mVehicles.offset
+PLAYER_CORE = _field_struct(rF2VehicleTelemetry, [
+    'mID', 'mElapsedTime', 'mLapNumber', 'mLapStartET', 'mVehicleName', 'mTrackName',
+    'mPos.x', 'mPos.y', 'mPos.z',
+    'mLocalVel.x', 'mLocalVel.y', 'mLocalVel.z',
+    'mLocalAccel.x', 'mLocalAccel.y', 'mLocalAccel.z',
+    'mGear', 'mEngineRPM', 'mEngineWaterTemp', 'mEngineOilTemp',
+    'mUnfilteredThrottle', 'mUnfilteredBrake', 'mUnfilteredSteering', 'mUnfilteredClutch',
+    'mSteeringShaftTorque', 'mFuel', 'mEngineMaxRPM', 'mOverheating', 'mEngineTorque',
+    'mCurrentSector', 'mMaxGears', 'mFuelCapacity', 'mTurboBoostPressure',
+])
+PLAYER_AERO = _field_struct(rF2VehicleTelemetry, [
+    'mFrontWingHeight', 'mFrontRideHeight', 'mRearRideHeight',
+    'mDrag', 'mFrontDownforce', 'mRearDownforce', 'mRearBrakeBias',
+])
+PLAYER_COMPOUNDS = _field_struct(
+    rF2VehicleTelemetry, ['mFrontTireCompoundName', 'mRearTireCompoundName'])
+PLAYER_DAMAGE = _field_struct(rF2VehicleTelemetry, ['mLastImpactMagnitude'])
+
+# Per-wheel fields, one unpack per corner (FL, FR, RL, RR)
+PLAYER_WHEELS_OFFSET = PLAYER_TELEMETRY_OFFSET + rF2VehicleTelemetry.mWheels.offset
+PLAYER_WHEEL_OFFSETS = tuple(
+    PLAYER_WHEELS_OFFSET + i * ctypes.sizeof(rF2Wheel) for i in range(4))
+PLAYER_WHEEL = _field_struct(rF2Wheel, [
+    'mSuspensionDeflection', 'mRideHeight', 'mSuspForce', 'mBrakeTemp', 'mBrakePressure',
+    'mRotation', 'mCamber', 'mLateralForce', 'mLongitudinalForce', 'mTireLoad', 'mGripFract',
+    'mPressure', 'mTemperature', 'mWear', 'mSurfaceType', 'mFlat', 'mToe',
+    'mTireCarcassTemperature',
+])
+
+# Session fields used by read_scoring, all in the header before mVehicles
+SCORING_HEADER = _field_struct(rF2Scoring, [
+    'mTrackName', 'mSession', 'mCurrentET', 'mEndET', 'mMaxLaps', 'mLapDist', 'mNumVehicles',
+    'mGamePhase', 'mYellowFlagState', 'mSectorFlag', 'mStartLight', 'mInRealtime',
+    'mPlayerName', 'mDarkCloud', 'mRaining', 'mAmbientTemp', 'mTrackTemp',
+    'mWind.x', 'mWind.y', 'mWind.z', 'mMinPathWetness', 'mMaxPathWetness',
+    'mAvgPathWetness',
+])
+
+# Bytes of each map that read_telemetry / read_scoring actually parse. The
+# wheels are the last block of the vehicle, a read without them stops short.
+TELEMETRY_SNAPSHOT_SIZE = PLAYER_TELEMETRY_OFFSET + ctypes.sizeof(rF2VehicleTelemetry)
+SCORING_HEADER_SIZE = rF2Scoring.mVehicles.offset
+
+# Vehicle fields used by read_vehicle_scoring; vehicle i starts at
+# VEHICLE_SCORING_OFFSET + i * VEHICLE_SCORING_SIZE
+SCORING_NUM_VEHICLES = _field_struct(rF2Scoring, ['mNumVehicles'])
+VEHICLE_SCORING_OFFSET = rF2Scoring.mVehicles.offset
+VEHICLE_SCORING_SIZE = ctypes.sizeof(rF2VehicleScoring)
+VEHICLE_SCORING = _field_struct(rF2VehicleScoring, [
+    'mID', 'mDriverName', 'mVehicleName', 'mTotalLaps', 'mSector', 'mFinishStatus', 'mLapDist',
+    'mBestSector1', 'mBestSector2', 'mBestLapTime', 'mLastSector1', 'mLastSector2',
+    'mLastLapTime', 'mCurSector1', 'mCurSector2', 'mNumPitstops', 'mNumPenalties', 'mIsPlayer',
+    'mInPits', 'mPlace', 'mVehicleClass', 'mTimeBehindNext', 'mLapsBehindNext',
+    'mTimeBehindLeader', 'mLapsBehindLeader', 'mSpeed', 'mPitState', 'mTimeIntoLap',
+    'mEstimatedLapTime', 'mFlag', 'mUnderYellow',
+], stride=True)
+# Numeric VEHICLE_SCORING fields as columns, named like VehicleScoringData
+VEHICLE_SCORING_DTYPE = _field_dtype(rF2VehicleScoring, {
+    'driver_id': 'mID', 'total_laps': 'mTotalLaps', 'current_sector': 'mSector',
+    'finish_status': 'mFinishStatus', 'lap_dist': 'mLapDist',
+    'best_sector1': 'mBestSector1', 'best_sector2': 'mBestSector2',
+    'best_lap_time': 'mBestLapTime', 'last_sector1': 'mLastSector1',
+    'last_sector2': 'mLastSector2', 'last_lap_time': 'mLastLapTime',
+    'cur_sector1': 'mCurSector1', 'cur_sector2': 'mCurSector2',
+    'num_pitstops': 'mNumPitstops', 'num_penalties': 'mNumPenalties',
+    'is_player': 'mIsPlayer', 'in_pits': 'mInPits', 'place': 'mPlace',
+    'time_behind_next': 'mTimeBehindNext', 'laps_behind_next': 'mLapsBehindNext',
+    'time_behind_leader': 'mTimeBehindLeader', 'laps_behind_leader': 'mLapsBehindLeader',
+    'speed': 'mSpeed', 'pit_state': 'mPitState', 'time_into_lap': 'mTimeIntoLap',
+    'estimated_lap_time': 'mEstimatedLapTime', 'flag': 'mFlag', 'under_yellow': 'mUnderYellow',
+})
+VEHICLE_IS_PLAYER = _field_struct(rF2VehicleScoring, ['mIsPlayer'], stride=True)
+VEHICLE_PLAYER_KEY = _field_struct(rF2VehicleScoring, ['mID', 'mIsPlayer'])
+EXTENDED = _field_struct(rF2Extended, [
+    'mPhysics.mTractionControl', 'mPhysics.mAntiLockBrakes', 'mPhysics.mStabilityControl',
+    'mPhysics.mAutoShift', 'mPhysics.mFuelMult', 'mPhysics.mTireMult',
+    'mInRealtimeFC', 'mSessionStarted',
+])
+
+# The whole force feedback map: begin, end, force value
+FORCE_FEEDBACK = _field_struct(
+    rF2ForceFeedback, ['mVersionUpdateBegin', 'mVersionUpdateEnd', 'mForceValue'])
+
+
+def _view_buffer(view: int, struct_type) -> memoryview:
+    """Read-only, bounds-checked byte view over a mapped view of struct_type"""
+    raw = (ctypes.c_char * ctypes.sizeof(struct_type)).from_address(view)
+    return memoryview(raw).cast('B').toreadonly()
+
+
+def _prefault(buffer: memoryview) -> None:
+    """
+    Touch one byte per page of a mapped view.
+
+    The pages are then resident before the first poll, instead of faulting
+    in on the read path during the first ticks after connecting.
+    """
+    bytes(buffer[::mmap.PAGESIZE])
+
+
+def _cstr(raw: bytes) -> str:
+    """Decode a NUL-terminated char array"""
+    return raw.split(b'\x00', 1)[0].decode('utf-8', errors='ignore')
+
+
 # ============= DATA CLASSES FOR CLEAN OUTPUT =============
 
-@dataclass
+CORNER_QUANTITIES = 5  # Rows of TelemetryData.corners
+
+
+def _corner(array_name: str, index: int) -> property:
+    """Read-only float property for one corner of a per-corner array field"""
+    return property(lambda self: float(getattr(self, array_name)[index]))
+
+
+@dataclass(slots=True)
 class WheelData:
     suspension_deflection: float = 0.0
     ride_height: float = 0.0
@@ -379,7 +573,7 @@ class WheelData:
     surface_type: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryData:
     # Identity
     vehicle_name: str = ""
@@ -449,37 +643,63 @@ class TelemetryData:
     # Wheels
     wheels: List[WheelData] = field(default_factory=lambda: [WheelData() for _ in range(4)])
 
-    # Aggregated tire data
-    tire_temp_fl: float = 0.0
-    tire_temp_fr: float = 0.0
-    tire_temp_rl: float = 0.0
-    tire_temp_rr: float = 0.0
+    # Aggregated tire data: one row per quantity, one column per corner
+    # (FL, FR, RL, RR), filled in one assignment. The named arrays are views
+    # of its rows, bound in __post_init__.
+    corners: np.ndarray = field(
+        default_factory=lambda: np.zeros((CORNER_QUANTITIES, 4)), repr=False)
+    tire_temps: np.ndarray = field(init=False)  # Celsius, avg of 3
+    tire_pressures: np.ndarray = field(init=False)
+    tire_wear: np.ndarray = field(init=False)  # 1 - rF2 wear
+    brake_temps: np.ndarray = field(init=False)
+    grips: np.ndarray = field(init=False)
+
+    # Damage
+    last_impact_magnitude: float = 0.0
+
+    # False only on INVALID_TELEMETRY, returned when a read fails
+    valid: bool = True
 
-    tire_pressure_fl: float = 0.0
-    tire_pressure_fr: float = 0.0
-    tire_pressure_rl: float = 0.0
-    tire_pressure_rr: float = 0.0
+    # Per-corner views of the arrays above
+    tire_temp_fl = _corner('tire_temps', 0)
+    tire_temp_fr = _corner('tire_temps', 1)
+    tire_temp_rl = _corner('tire_temps', 2)
+    tire_temp_rr = _corner('tire_temps', 3)
 
-    tire_wear_fl: float = 0.0
-    tire_wear_fr: float = 0.0
-    tire_wear_rl: float = 0.0
-    tire_wear_rr: float = 0.0
+    tire_pressure_fl = _corner('tire_pressures', 0)
+    tire_pressure_fr = _corner('tire_pressures', 1)
+    tire_pressure_rl = _corner('tire_pressures', 2)
+    tire_pressure_rr = _corner('tire_pressures', 3)
 
-    brake_temp_fl: float = 0.0
-    brake_temp_fr: float = 0.0
-    brake_temp_rl: float = 0.0
-    brake_temp_rr: float = 0.0
+    tire_wear_fl = _corner('tire_wear', 0)
+    tire_wear_fr = _corner('tire_wear', 1)
+    tire_wear_rl = _corner('tire_wear', 2)
+    tire_wear_rr = _corner('tire_wear', 3)
 
-    grip_fl: float = 0.0
-    grip_fr: float = 0.0
-    grip_rl: float = 0.0
-    grip_rr: float = 0.0
+    brake_temp_fl = _corner('brake_temps', 0)
+    brake_temp_fr = _corner('brake_temps', 1)
+    brake_temp_rl = _corner('brake_temps', 2)
+    brake_temp_rr = _corner('brake_temps', 3)
 
-    # Damage
-    last_impact_magnitude: float = 0.0
+    grip_fl = _corner('grips', 0)
+    grip_fr = _corner('grips', 1)
+    grip_rl = _corner('grips', 2)
+    grip_rr = _corner('grips', 3)
+
+    def __post_init__(self):
+        (self.tire_temps, self.tire_pressures, self.tire_wear, self.brake_temps,
+         self.grips) = self.corners
 
+    def copy(self) -> 'TelemetryData':
+        """Independent copy, for keeping a frame beyond read_telemetry()'s two buffers"""
+        return replace(
+            self, wheels=[replace(w) for w in self.wheels], corners=self.corners.copy())
 
-@dataclass
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+@dataclass(slots=True)
 class ScoringData:
     # Session
     track_name: str = ""
@@ -512,8 +732,14 @@ class ScoringData:
     # Player
     player_name: str = ""
 
+    # False only on INVALID_SCORING, returned when a read fails
+    valid: bool = True
+
+    def __bool__(self) -> bool:
+        return self.valid
+
 
-@dataclass
+@dataclass(slots=True)
 class VehicleScoringData:
     driver_id: int = 0
     driver_name: str = ""
@@ -557,8 +783,14 @@ class VehicleScoringData:
     # Speed
     speed: float = 0.0
 
+    # False only on INVALID_VEHICLE_SCORING, returned when a read fails
+    valid: bool = True
 
-@dataclass
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+@dataclass(slots=True)
 class ExtendedData:
     # Physics options
     traction_control: int = 0
@@ -572,6 +804,30 @@ class ExtendedData:
     in_realtime: bool = False
     session_started: bool = False
 
+    # False only on INVALID_EXTENDED, returned when a read fails
+    valid: bool = True
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+# Returned by the read_* methods instead of None when nothing could be read.
+# They are falsy, so `if data:` checks keep working; shared, don't modify.
+INVALID_TELEMETRY = TelemetryData(valid=False)
+INVALID_SCORING = ScoringData(valid=False)
+INVALID_VEHICLE_SCORING = VehicleScoringData(valid=False)
+INVALID_EXTENDED = ExtendedData(valid=False)
+
+
+class TelemetrySection(IntFlag):
+    """Field groups read_telemetry can be limited to"""
+    CORE = 1       # Identity, motion, engine, inputs, fuel, lap
+    WHEELS = 2     # wheels[] and the aggregated per-corner tire/brake fields
+    AERO = 4       # Ride heights, rake, downforce, drag, wing, brake bias
+    COMPOUNDS = 8  # Tire compound names
+    DAMAGE = 16
+    ALL = CORE | WHEELS | AERO | COMPOUNDS | DAMAGE
+
 
 # ============= MAIN READER CLASS =============
 
@@ -586,9 +842,48 @@ class RF2SharedMemory:
         self.ffb_handle = None
         self.ffb_view = None
 
+        # memoryviews over the mapped views, for zero-copy struct.unpack_from
+        self.telemetry_buffer: Optional[memoryview] = None
+        self.scoring_buffer: Optional[memoryview] = None
+        self.extended_buffer: Optional[memoryview] = None
+        self.ffb_buffer: Optional[memoryview] = None
+
         self.connected = False
         self.last_error = ""
 
+        # read_telemetry() parses a new frame into the back buffer and then
+        # flips, so the frame a caller holds isn't written by the next read
+        self._telemetry_bufs = (TelemetryData(), TelemetryData())
+        self._telemetry_front = 0
+
+        # Telemetry version the last read parsed, what it parsed and its result
+        self._telemetry_version: Optional[int] = None
+        self._telemetry_sections = TelemetrySection(0)
+        self._telemetry_result: TelemetryData = INVALID_TELEMETRY
+
+        # Private copies the parsers read from, so the game can't write mid-parse
+        self._telemetry_snapshot = bytearray(TELEMETRY_SNAPSHOT_SIZE)
+        self._scoring_snapshot = bytearray(SCORING_HEADER_SIZE)
+
+        # Raw char array -> decoded str; names only change between sessions
+        self._str_cache: Dict[bytes, str] = {}
+
+        # read_all() stream -> (map version, result); see _read_if_updated()
+        self._stream_cache: Dict[str, tuple] = {}
+
+        # One VehicleScoringData per grid slot, refilled by read_all_vehicles_scoring()
+        self._vehicle_pool: List[VehicleScoringData] = []
+
+        # Background refresh for read_all(nowait=True); see start_refresh()
+        self._read_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self._latest: Optional[Dict[str, Any]] = None
+
+        # Where read_player_scoring() last found the player, and their mID
+        self._player_index: Optional[int] = None
+        self._player_id: Optional[int] = None
+
     def connect(self) -> bool:
         """Connect to all rF2 shared memory maps"""
         try:
@@ -596,21 +891,33 @@ class RF2SharedMemory:
             self.telemetry_handle = OpenFileMappingW(FILE_MAP_READ, False, RF2_TELEMETRY_NAME)
             if self.telemetry_handle:
                 self.telemetry_view = MapViewOfFile(self.telemetry_handle, FILE_MAP_READ, 0, 0, 0)
+            if self.telemetry_view:
+                self.telemetry_buffer = _view_buffer(self.telemetry_view, rF2Telemetry)
+                _prefault(self.telemetry_buffer)
 
             # Scoring
             self.scoring_handle = OpenFileMappingW(FILE_MAP_READ, False, RF2_SCORING_NAME)
             if self.scoring_handle:
                 self.scoring_view = MapViewOfFile(self.scoring_handle, FILE_MAP_READ, 0, 0, 0)
+            if self.scoring_view:
+                self.scoring_buffer = _view_buffer(self.scoring_view, rF2Scoring)
+                _prefault(self.scoring_buffer)
 
             # Extended
             self.extended_handle = OpenFileMappingW(FILE_MAP_READ, False, RF2_EXTENDED_NAME)
             if self.extended_handle:
                 self.extended_view = MapViewOfFile(self.extended_handle, FILE_MAP_READ, 0, 0, 0)
+            if self.extended_view:
+                self.extended_buffer = _view_buffer(self.extended_view, rF2Extended)
+                _prefault(self.extended_buffer)
 
             # Force Feedback
             self.ffb_handle = OpenFileMappingW(FILE_MAP_READ, False, RF2_FORCE_FEEDBACK_NAME)
             if self.ffb_handle:
                 self.ffb_view = MapViewOfFile(self.ffb_handle, FILE_MAP_READ, 0, 0, 0)
+            if self.ffb_view:
+                self.ffb_buffer = _view_buffer(self.ffb_view, rF2ForceFeedback)
+                _prefault(self.ffb_buffer)
 
             self.connected = bool(self.telemetry_view)
 
@@ -625,6 +932,19 @@ class RF2SharedMemory:
 
     def disconnect(self):
         """Disconnect from all shared memory maps"""
+        self.stop_refresh()
+        self._latest = None
+
+        # Drop the views first so nothing can read an unmapped view
+        for buffer in (self.telemetry_buffer, self.scoring_buffer,
+                       self.extended_buffer, self.ffb_buffer):
+            if buffer is not None:
+                buffer.release()
+        self.telemetry_buffer = None
+        self.scoring_buffer = None
+        self.extended_buffer = None
+        self.ffb_buffer = None
+
         if self.telemetry_view:
             UnmapViewOfFile(self.telemetry_view)
         if self.telemetry_handle:
@@ -651,337 +971,566 @@ class RF2SharedMemory:
         self.ffb_handle = None
         self.ffb_view = None
         self.connected = False
-
-    def _kelvin_to_celsius(self, kelvin: float) -> float:
-        if kelvin < 100:
-            return kelvin  # Already Celsius
-        return kelvin - 273.15
-
-    def _read_telemetry_raw(self) -> Optional[rF2Telemetry]:
-        """Read raw telemetry structure"""
+        self._telemetry_version = None
+        self._telemetry_result = INVALID_TELEMETRY
+        self._stream_cache.clear()
+        self._player_index = None
+        self._player_id = None
+
+    def _decode(self, raw: bytes) -> str:
+        text = self._str_cache.get(raw)
+        if text is None:
+            text = _cstr(raw)
+            if len(self._str_cache) >= DECODE_CACHE_SIZE:
+                self._str_cache.clear()
+            self._str_cache[raw] = text
+        return text
+
+    def _read_consistent(self, buf: memoryview, dest: bytearray, size: int) -> Optional[int]:
+        """
+        Copy the first size bytes of a mapping into dest without tearing.
+
+        rF2 bumps mVersionUpdateBegin before writing a buffer and
+        mVersionUpdateEnd after, so the copy is whole when End read before it
+        equals Begin read after it. The writer only holds the buffer for
+        microseconds; spin a few times before giving up on this poll. While
+        the counters already disagree only they are read, the body is not
+        copied until a write has finished.
+        Returns the version copied, or None.
+        """
+        # Counters and body go through the memoryview: struct.unpack_from and
+        # a slice copy are cheaper than a ctypes object per counter read or
+        # a ctypes.memmove call
+        for _ in range(CONSISTENT_READ_RETRIES):
+            begin, end = VERSION_COUNTERS.unpack_from(buf)
+            if begin != end:
+                time.sleep(0)  # Mid-update, don't touch the vehicle pages
+                continue
+            dest[:size] = buf[:size]
+            begin, _ = VERSION_COUNTERS.unpack_from(buf)
+            if begin == end:
+                return end
+            time.sleep(0)
+        return None
+
+    def _read_telemetry_raw(self) -> Optional[memoryview]:
+        """Raw telemetry mapping as bytes (a view, not a copy)"""
+        return self.telemetry_buffer
+
+    def _read_scoring_raw(self) -> Optional[memoryview]:
+        """Raw scoring mapping as bytes (a view, not a copy)"""
+        return self.scoring_buffer
+
+    def _read_extended_raw(self) -> Optional[memoryview]:
+        """Raw extended mapping as bytes (a view, not a copy)"""
+        return self.extended_buffer
+
+    def _read_ffb_raw(self) -> Optional[memoryview]:
+        """Raw force feedback mapping as bytes (a view, not a copy)"""
+        return self.ffb_buffer
+
+    def read_telemetry(
+        self, sections: TelemetrySection = TelemetrySection.ALL
+    ) -> TelemetryData:
+        """
+        Read and process telemetry data for player vehicle.
+
+        Only the requested sections are parsed; the fields of the others are
+        left from an earlier frame. Two TelemetryData instances are reused in
+        turn, so a returned frame stays intact through the next call; use
+        .copy() to keep it longer. Returns INVALID_TELEMETRY when no frame
+        could be read.
+
+        Not thread-safe: the snapshot and the two buffers are shared by all
+        callers. Read from several threads through read_all(), which
+        serializes the reads (and is the only reader allowed while
+        start_refresh() runs).
+        """
         if not self.telemetry_view:
-            return None
-
-        return ctypes.cast(self.telemetry_view, ctypes.POINTER(rF2Telemetry)).contents
-
-    def _read_scoring_raw(self) -> Optional[rF2Scoring]:
-        """Read raw scoring structure"""
-        if not self.scoring_view:
-            return None
-
-        return ctypes.cast(self.scoring_view, ctypes.POINTER(rF2Scoring)).contents
-
-    def _read_extended_raw(self) -> Optional[rF2Extended]:
-        """Read raw extended structure"""
-        if not self.extended_view:
-            return None
-
-        return ctypes.cast(self.extended_view, ctypes.POINTER(rF2Extended)).contents
-
-    def _read_ffb_raw(self) -> Optional[rF2ForceFeedback]:
-        """Read raw force feedback structure"""
-        if not self.ffb_view:
-            return None
-
-        return ctypes.cast(self.ffb_view, ctypes.POINTER(rF2ForceFeedback)).contents
-
-    def read_telemetry(self) -> Optional[TelemetryData]:
-        """Read and process telemetry data for player vehicle"""
-        raw = self._read_telemetry_raw()
-        if not raw or raw.mNumVehicles <= 0:
-            return None
+            return INVALID_TELEMETRY
+
+        # rF2 only bumps the counters when it publishes, an unchanged pair
+        # means the last result is still current
+        begin, end = VERSION_COUNTERS.unpack_from(self.telemetry_buffer)
+        if (begin == end == self._telemetry_version
+                and not sections & ~self._telemetry_sections):
+            return self._telemetry_result
+
+        with_wheels = sections & TelemetrySection.WHEELS
+        size = TELEMETRY_SNAPSHOT_SIZE if with_wheels else PLAYER_WHEELS_OFFSET
+        raw = self._telemetry_snapshot
+        version = self._read_consistent(self.telemetry_buffer, raw, size)
+        if version is None:
+            return INVALID_TELEMETRY  # Still being updated after the retries
+
+        if version == self._telemetry_version:
+            # Same frame with more sections: complete the published buffer
+            missing = sections & ~self._telemetry_sections
+            front = self._telemetry_bufs[self._telemetry_front]
+            result = self._parse_telemetry(raw, missing, front)
+            self._telemetry_sections |= sections
+            self._telemetry_result = result
+            return result
+
+        back = self._telemetry_front ^ 1
+        result = self._parse_telemetry(raw, sections, self._telemetry_bufs[back])
+        if result.valid:
+            self._telemetry_front = back
+        self._telemetry_version = version
+        self._telemetry_sections = sections
+        self._telemetry_result = result
+        return result
+
+    def wait_for_update(
+        self, stream: str = 'telemetry', timeout: float = 0.05,
+        max_interval: float = UPDATE_MAX_SLEEP,
+    ) -> bool:
+        """
+        Block until rF2 publishes a map newer than the last one read.
+
+        stream is 'telemetry' (compared with the last read_telemetry()),
+        'scoring' or 'extended' (compared with the last read_all()). Only the
+        4-byte update counter is polled: busy for a short spin, since a
+        publish is usually imminent, then sleeping with exponential backoff
+        up to max_interval. Returns False on timeout or when not connected.
+        """
+        if stream == 'telemetry':
+            buffer, seen = self.telemetry_buffer, self._telemetry_version
+        elif stream in ('scoring', 'extended'):
+            buffer = self.scoring_buffer if stream == 'scoring' else self.extended_buffer
+            seen = self._stream_cache.get(stream, (None,))[0]
+        else:
+            raise ValueError(f"Unknown stream: {stream}")
+        if buffer is None:
+            return False
 
-        # Check version consistency
-        if raw.mVersionUpdateBegin != raw.mVersionUpdateEnd:
-            return None  # Data being updated
-
-        # Find player vehicle (first one or marked as player in scoring)
-        veh = raw.mVehicles[0]
-
-        data = TelemetryData()
-
-        # Identity
-        data.vehicle_name = veh.mVehicleName.decode('utf-8', errors='ignore').strip('\x00')
-        data.track_name = veh.mTrackName.decode('utf-8', errors='ignore').strip('\x00')
-        data.driver_id = veh.mID
-
-        # Position
-        data.pos_x = veh.mPos.x
-        data.pos_y = veh.mPos.y
-        data.pos_z = veh.mPos.z
-
-        # Speed
-        data.local_vel_x = veh.mLocalVel.x
-        data.local_vel_y = veh.mLocalVel.y
-        data.local_vel_z = veh.mLocalVel.z
-        data.speed = (veh.mLocalVel.x**2 + veh.mLocalVel.y**2 + veh.mLocalVel.z**2)**0.5
-        data.speed_kmh = data.speed * 3.6
-
-        # G-forces
-        data.g_long = veh.mLocalAccel.x / 9.81
-        data.g_lat = veh.mLocalAccel.z / 9.81
-        data.g_vert = veh.mLocalAccel.y / 9.81
-
-        # Engine
-        data.rpm = veh.mEngineRPM
-        data.rpm_max = veh.mEngineMaxRPM
-        data.gear = veh.mGear
-        data.max_gears = veh.mMaxGears
-        data.engine_torque = veh.mEngineTorque
-        data.water_temp = self._kelvin_to_celsius(veh.mEngineWaterTemp)
-        data.oil_temp = self._kelvin_to_celsius(veh.mEngineOilTemp)
-        data.overheating = bool(veh.mOverheating)
-        data.turbo_boost = veh.mTurboBoostPressure
-
-        # Inputs
-        data.throttle = veh.mUnfilteredThrottle
-        data.brake = veh.mUnfilteredBrake
-        data.steering = veh.mUnfilteredSteering
-        data.clutch = veh.mUnfilteredClutch
-        data.steering_torque = veh.mSteeringShaftTorque
-
-        # Fuel
-        data.fuel = veh.mFuel
-        data.fuel_capacity = veh.mFuelCapacity
-        data.fuel_pct = (veh.mFuel / veh.mFuelCapacity * 100) if veh.mFuelCapacity > 0 else 0
-
-        # Lap
-        data.lap_number = veh.mLapNumber
-        data.current_sector = veh.mCurrentSector
-        data.lap_start_et = veh.mLapStartET
-        data.elapsed_time = veh.mElapsedTime
-
-        # Aero & Chassis
-        data.front_ride_height = veh.mFrontRideHeight * 1000  # m to mm
-        data.rear_ride_height = veh.mRearRideHeight * 1000
-        data.rake = (veh.mRearRideHeight - veh.mFrontRideHeight) * 1000
-        data.front_downforce = veh.mFrontDownforce
-        data.rear_downforce = veh.mRearDownforce
-        data.drag = veh.mDrag
-        data.front_wing_height = veh.mFrontWingHeight
-        data.rear_brake_bias = veh.mRearBrakeBias
-
-        # Compounds
-        data.front_tire_compound = veh.mFrontTireCompoundName.decode('utf-8', errors='ignore').strip('\x00')
-        data.rear_tire_compound = veh.mRearTireCompoundName.decode('utf-8', errors='ignore').strip('\x00')
-
-        # Damage
-        data.last_impact_magnitude = veh.mLastImpactMagnitude
+        # Read through the memoryview: disconnect() releases it before
+        # unmapping, so a waiter then gets a ValueError, not unmapped memory
+        unpack = VERSION_COUNTERS.unpack_from
+        try:
+            for _ in range(UPDATE_SPIN_COUNT):
+                if unpack(buffer)[1] != seen:
+                    return True
+
+            deadline = time.monotonic() + timeout
+            interval = min(UPDATE_MIN_SLEEP, max_interval)
+            while unpack(buffer)[1] == seen:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 2, max_interval)
+        except ValueError:
+            return False  # Disconnected while waiting
+        return True
+
+    def wait_for_telemetry(self, timeout: float = 0.1, poll_interval: float = 0.001) -> bool:
+        """Block until rF2 publishes telemetry newer than the last read_telemetry()"""
+        return self.wait_for_update('telemetry', timeout, max_interval=poll_interval)
+
+    def _parse_telemetry(
+        self, raw, sections: TelemetrySection, data: TelemetryData
+    ) -> TelemetryData:
+        """Fill data from a consistent snapshot"""
+        with_wheels = sections & TelemetrySection.WHEELS
+        _, _, num_vehicles = TELEMETRY_HEADER.unpack_from(raw)
+        if num_vehicles <= 0:
+            return INVALID_TELEMETRY
+
+        # Player vehicle is the first one (or the one marked as player in scoring)
+        if sections & TelemetrySection.CORE:
+            (
+                data.driver_id, data.elapsed_time, data.lap_number, data.lap_start_et,
+                vehicle_name, track_name,
+                data.pos_x, data.pos_y, data.pos_z,
+                data.local_vel_x, data.local_vel_y, data.local_vel_z,
+                accel_x, accel_y, accel_z,
+                data.gear, data.rpm, water_temp, oil_temp,
+                data.throttle, data.brake, data.steering, data.clutch,
+                data.steering_torque, data.fuel, data.rpm_max, overheating, data.engine_torque,
+                data.current_sector, data.max_gears, data.fuel_capacity, data.turbo_boost,
+            ) = PLAYER_CORE.unpack_from(raw, PLAYER_TELEMETRY_OFFSET)
+
+            # Identity
+            data.vehicle_name = self._decode(vehicle_name)
+            data.track_name = self._decode(track_name)
+
+            # Speed
+            data.speed = (data.local_vel_x**2 + data.local_vel_y**2 + data.local_vel_z**2)**0.5
+            data.speed_kmh = data.speed * 3.6
+
+            # G-forces
+            data.g_long = accel_x / 9.81
+            data.g_lat = accel_z / 9.81
+            data.g_vert = accel_y / 9.81
+
+            # Engine
+            # Temperatures: Kelvin, except readings under 100 which are already
+            # Celsius. Converted inline, this runs 22 times per frame.
+            data.water_temp = water_temp if water_temp < 100 else water_temp - 273.15
+            data.oil_temp = oil_temp if oil_temp < 100 else oil_temp - 273.15
+            data.overheating = bool(overheating)
+
+            # Fuel
+            data.fuel_pct = (data.fuel / data.fuel_capacity * 100) if data.fuel_capacity > 0 else 0
+
+        if sections & TelemetrySection.AERO:
+            (
+                data.front_wing_height, front_ride_height, rear_ride_height,
+                data.drag, data.front_downforce, data.rear_downforce, data.rear_brake_bias,
+            ) = PLAYER_AERO.unpack_from(raw, PLAYER_TELEMETRY_OFFSET)
+            data.front_ride_height = front_ride_height * 1000  # m to mm
+            data.rear_ride_height = rear_ride_height * 1000
+            data.rake = (rear_ride_height - front_ride_height) * 1000
+
+        if sections & TelemetrySection.COMPOUNDS:
+            front_compound, rear_compound = PLAYER_COMPOUNDS.unpack_from(
+                raw, PLAYER_TELEMETRY_OFFSET)
+            data.front_tire_compound = self._decode(front_compound)
+            data.rear_tire_compound = self._decode(rear_compound)
+
+        if sections & TelemetrySection.DAMAGE:
+            data.last_impact_magnitude, = PLAYER_DAMAGE.unpack_from(raw, PLAYER_TELEMETRY_OFFSET)
+
+        if not with_wheels:
+            return data
 
         # Process wheels
-        for i in range(4):
-            w = veh.mWheels[i]
-            wd = WheelData()
-
-            wd.suspension_deflection = w.mSuspensionDeflection
-            wd.ride_height = w.mRideHeight * 1000  # m to mm
-            wd.susp_force = w.mSuspForce
-            wd.brake_temp = self._kelvin_to_celsius(w.mBrakeTemp)
-            wd.brake_pressure = w.mBrakePressure
-            wd.rotation = w.mRotation
-            wd.camber = w.mCamber * 57.2958  # rad to deg
-            wd.lateral_force = w.mLateralForce
-            wd.longitudinal_force = w.mLongitudinalForce
-            wd.tire_load = w.mTireLoad
-            wd.grip = w.mGripFract
-            wd.pressure = w.mPressure
-            wd.temp_inner = self._kelvin_to_celsius(w.mTemperature[0])
-            wd.temp_middle = self._kelvin_to_celsius(w.mTemperature[1])
-            wd.temp_outer = self._kelvin_to_celsius(w.mTemperature[2])
+        for wd, offset in zip(data.wheels, PLAYER_WHEEL_OFFSETS):
+            (
+                wd.suspension_deflection, ride_height, wd.susp_force, brake_temp,
+                wd.brake_pressure, wd.rotation, camber, wd.lateral_force,
+                wd.longitudinal_force, wd.tire_load, wd.grip, wd.pressure,
+                temp_inner, temp_middle, temp_outer, wd.wear, wd.surface_type, flat, toe,
+                carcass_temp,
+            ) = PLAYER_WHEEL.unpack_from(raw, offset)
+            wd.ride_height = ride_height * 1000  # m to mm
+            wd.camber = camber * 57.2958  # rad to deg
+            wd.toe = toe * 57.2958  # rad to deg
+            wd.flat = bool(flat)
+            # Kelvin to Celsius, as for water/oil above
+            wd.brake_temp = brake_temp if brake_temp < 100 else brake_temp - 273.15
+            wd.temp_inner = temp_inner if temp_inner < 100 else temp_inner - 273.15
+            wd.temp_middle = temp_middle if temp_middle < 100 else temp_middle - 273.15
+            wd.temp_outer = temp_outer if temp_outer < 100 else temp_outer - 273.15
+            wd.carcass_temp = carcass_temp if carcass_temp < 100 else carcass_temp - 273.15
             wd.temp_avg = (wd.temp_inner + wd.temp_middle + wd.temp_outer) / 3
-            wd.wear = w.mWear
-            wd.toe = w.mToe * 57.2958  # rad to deg
-            wd.carcass_temp = self._kelvin_to_celsius(w.mTireCarcassTemperature)
-            wd.flat = bool(w.mFlat)
-            wd.surface_type = w.mSurfaceType
-
-            data.wheels[i] = wd
 
         # Aggregated data for easy access
-        data.tire_temp_fl = data.wheels[0].temp_avg
-        data.tire_temp_fr = data.wheels[1].temp_avg
-        data.tire_temp_rl = data.wheels[2].temp_avg
-        data.tire_temp_rr = data.wheels[3].temp_avg
-
-        data.tire_pressure_fl = data.wheels[0].pressure
-        data.tire_pressure_fr = data.wheels[1].pressure
-        data.tire_pressure_rl = data.wheels[2].pressure
-        data.tire_pressure_rr = data.wheels[3].pressure
-
-        data.tire_wear_fl = 1 - data.wheels[0].wear
-        data.tire_wear_fr = 1 - data.wheels[1].wear
-        data.tire_wear_rl = 1 - data.wheels[2].wear
-        data.tire_wear_rr = 1 - data.wheels[3].wear
-
-        data.brake_temp_fl = data.wheels[0].brake_temp
-        data.brake_temp_fr = data.wheels[1].brake_temp
-        data.brake_temp_rl = data.wheels[2].brake_temp
-        data.brake_temp_rr = data.wheels[3].brake_temp
-
-        data.grip_fl = data.wheels[0].grip
-        data.grip_fr = data.wheels[1].grip
-        data.grip_rl = data.wheels[2].grip
-        data.grip_rr = data.wheels[3].grip
+        fl, fr, rl, rr = data.wheels
+        data.corners[:] = (
+            (fl.temp_avg, fr.temp_avg, rl.temp_avg, rr.temp_avg),
+            (fl.pressure, fr.pressure, rl.pressure, rr.pressure),
+            (1 - fl.wear, 1 - fr.wear, 1 - rl.wear, 1 - rr.wear),
+            (fl.brake_temp, fr.brake_temp, rl.brake_temp, rr.brake_temp),
+            (fl.grip, fr.grip, rl.grip, rr.grip),
+        )
 
         return data
 
-    def read_scoring(self) -> Optional[ScoringData]:
+    def read_scoring(self) -> ScoringData:
         """Read session/race scoring data"""
-        raw = self._read_scoring_raw()
-        if not raw:
-            return None
+        if not self.scoring_view:
+            return INVALID_SCORING
 
-        if raw.mVersionUpdateBegin != raw.mVersionUpdateEnd:
-            return None
+        raw = self._scoring_snapshot
+        if self._read_consistent(self.scoring_buffer, raw, SCORING_HEADER_SIZE) is None:
+            return INVALID_SCORING
 
         data = ScoringData()
 
-        data.track_name = raw.mTrackName.decode('utf-8', errors='ignore').strip('\x00')
-        data.session_type = raw.mSession
-        data.current_time = raw.mCurrentET
-        data.end_time = raw.mEndET
-        data.max_laps = raw.mMaxLaps
-        data.lap_distance = raw.mLapDist
-        data.num_vehicles = raw.mNumVehicles
-        data.game_phase = raw.mGamePhase
-        data.in_realtime = bool(raw.mInRealtime)
-
-        # Weather
-        data.ambient_temp = raw.mAmbientTemp
-        data.track_temp = raw.mTrackTemp
-        data.raining = raw.mRaining
-        data.dark_cloud = raw.mDarkCloud
-        data.wind_x = raw.mWind.x
-        data.wind_y = raw.mWind.y
-        data.wind_z = raw.mWind.z
-        data.min_path_wetness = raw.mMinPathWetness
-        data.max_path_wetness = raw.mMaxPathWetness
-        data.avg_path_wetness = raw.mAvgPathWetness
-
-        # Flags
-        data.yellow_flag_state = raw.mYellowFlagState
-        data.sector_flags = [raw.mSectorFlag[i] for i in range(3)]
-        data.start_light = raw.mStartLight
-
-        data.player_name = raw.mPlayerName.decode('utf-8', errors='ignore').strip('\x00')
+        (
+            track_name, data.session_type, data.current_time, data.end_time, data.max_laps,
+            data.lap_distance, data.num_vehicles,
+            data.game_phase, data.yellow_flag_state, *sector_flags, data.start_light, in_realtime,
+            player_name, data.dark_cloud, data.raining, data.ambient_temp, data.track_temp,
+            data.wind_x, data.wind_y, data.wind_z, data.min_path_wetness, data.max_path_wetness,
+            data.avg_path_wetness,
+        ) = SCORING_HEADER.unpack_from(raw)
+
+        data.track_name = self._decode(track_name)
+        data.in_realtime = bool(in_realtime)
+        data.sector_flags = sector_flags
+        data.player_name = self._decode(player_name)
 
         return data
 
-    def read_vehicle_scoring(self, vehicle_index: int = 0) -> Optional[VehicleScoringData]:
+    def read_vehicle_scoring(self, vehicle_index: int = 0) -> VehicleScoringData:
         """Read scoring data for a specific vehicle"""
-        raw = self._read_scoring_raw()
-        if not raw or vehicle_index >= raw.mNumVehicles:
-            return None
-
-        veh = raw.mVehicles[vehicle_index]
-
-        data = VehicleScoringData()
-
-        data.driver_id = veh.mID
-        data.driver_name = veh.mDriverName.decode('utf-8', errors='ignore').strip('\x00')
-        data.vehicle_name = veh.mVehicleName.decode('utf-8', errors='ignore').strip('\x00')
-        data.vehicle_class = veh.mVehicleClass.decode('utf-8', errors='ignore').strip('\x00')
-
-        data.place = veh.mPlace
-        data.total_laps = veh.mTotalLaps
-        data.current_sector = veh.mSector
-        data.lap_dist = veh.mLapDist
-
-        data.best_lap_time = veh.mBestLapTime
-        data.last_lap_time = veh.mLastLapTime
-        data.best_sector1 = veh.mBestSector1
-        data.best_sector2 = veh.mBestSector2
-        data.last_sector1 = veh.mLastSector1
-        data.last_sector2 = veh.mLastSector2
-        data.cur_sector1 = veh.mCurSector1
-        data.cur_sector2 = veh.mCurSector2
-        data.time_into_lap = veh.mTimeIntoLap
-        data.estimated_lap_time = veh.mEstimatedLapTime
-
-        data.time_behind_next = veh.mTimeBehindNext
-        data.laps_behind_next = veh.mLapsBehindNext
-        data.time_behind_leader = veh.mTimeBehindLeader
-        data.laps_behind_leader = veh.mLapsBehindLeader
-
-        data.is_player = bool(veh.mIsPlayer)
-        data.in_pits = bool(veh.mInPits)
-        data.pit_state = veh.mPitState
-        data.num_pitstops = veh.mNumPitstops
-        data.num_penalties = veh.mNumPenalties
-        data.finish_status = veh.mFinishStatus
-        data.flag = veh.mFlag
-        data.under_yellow = bool(veh.mUnderYellow)
-
-        data.speed = veh.mSpeed * 3.6  # m/s to km/h
+        buf = self.scoring_buffer
+        if buf is None:
+            return INVALID_VEHICLE_SCORING
+
+        num_vehicles, = SCORING_NUM_VEHICLES.unpack_from(buf)
+        if not 0 <= vehicle_index < num_vehicles:
+            return INVALID_VEHICLE_SCORING
+
+        return self._parse_vehicle_scoring(VEHICLE_SCORING.unpack_from(
+            buf, VEHICLE_SCORING_OFFSET + vehicle_index * VEHICLE_SCORING_SIZE))
+
+    def _parse_vehicle_scoring(self, fields: tuple) -> VehicleScoringData:
+        """VehicleScoringData from one VEHICLE_SCORING record"""
+        # Every field is assigned by the fill, skip the dataclass defaults
+        return self._fill_vehicle_scoring(
+            VehicleScoringData.__new__(VehicleScoringData), fields)
+
+    def _fill_vehicle_scoring(
+        self, data: VehicleScoringData, fields: tuple
+    ) -> VehicleScoringData:
+        """Overwrite every field of data from one VEHICLE_SCORING record"""
+        (
+            data.driver_id, driver_name, vehicle_name, data.total_laps, data.current_sector,
+            data.finish_status, data.lap_dist, data.best_sector1, data.best_sector2,
+            data.best_lap_time, data.last_sector1, data.last_sector2, data.last_lap_time,
+            data.cur_sector1, data.cur_sector2, data.num_pitstops, data.num_penalties, is_player,
+            in_pits, data.place, vehicle_class, data.time_behind_next, data.laps_behind_next,
+            data.time_behind_leader, data.laps_behind_leader, speed, data.pit_state,
+            data.time_into_lap, data.estimated_lap_time, data.flag, under_yellow,
+        ) = fields
+
+        # Runs once per car for a whole grid: the names are almost always
+        # cached, so look them up directly and only call _decode on a miss
+        cache = self._str_cache
+        data.driver_name = cache.get(driver_name) or self._decode(driver_name)
+        data.vehicle_name = cache.get(vehicle_name) or self._decode(vehicle_name)
+        data.vehicle_class = cache.get(vehicle_class) or self._decode(vehicle_class)
+        data.is_player = is_player != 0
+        data.in_pits = in_pits != 0
+        data.under_yellow = under_yellow != 0
+        data.speed = speed * 3.6  # m/s to km/h
+        data.valid = True
 
         return data
 
-    def read_player_scoring(self) -> Optional[VehicleScoringData]:
+    def read_player_scoring(self) -> VehicleScoringData:
         """Find and read scoring data for the player"""
-        raw = self._read_scoring_raw()
-        if not raw:
-            return None
-
-        for i in range(raw.mNumVehicles):
-            veh = raw.mVehicles[i]
-            if veh.mIsPlayer:
-                return self.read_vehicle_scoring(i)
-
-        return self.read_vehicle_scoring(0)  # Fallback to first vehicle
+        buf = self.scoring_buffer
+        if buf is None:
+            return INVALID_VEHICLE_SCORING
+
+        num_vehicles, = SCORING_NUM_VEHICLES.unpack_from(buf)
+        num_vehicles = max(0, min(num_vehicles, MAX_MAPPED_VEHICLES))
+        if num_vehicles == 0:
+            return INVALID_VEHICLE_SCORING
+
+        # The player keeps their slot within a session: check the cached one
+        # first and only rescan when it no longer holds the same player
+        player = self._player_index
+        if player is not None and player < num_vehicles:
+            driver_id, is_player = VEHICLE_PLAYER_KEY.unpack_from(
+                buf, VEHICLE_SCORING_OFFSET + player * VEHICLE_SCORING_SIZE)
+            if not is_player or driver_id != self._player_id:
+                player = None
+        else:
+            player = None
+
+        if player is None:
+            # Scan only the mIsPlayer bytes
+            records = buf[VEHICLE_SCORING_OFFSET:
+                          VEHICLE_SCORING_OFFSET + num_vehicles * VEHICLE_SCORING_SIZE]
+            player = 0  # Fallback to first vehicle
+            for i, (is_player,) in enumerate(VEHICLE_IS_PLAYER.iter_unpack(records)):
+                if is_player:
+                    player = i
+                    self._player_index = i
+                    self._player_id, _ = VEHICLE_PLAYER_KEY.unpack_from(
+                        buf, VEHICLE_SCORING_OFFSET + i * VEHICLE_SCORING_SIZE)
+                    break
+
+        return self._parse_vehicle_scoring(VEHICLE_SCORING.unpack_from(
+            buf, VEHICLE_SCORING_OFFSET + player * VEHICLE_SCORING_SIZE))
 
     def read_all_vehicles_scoring(self) -> List[VehicleScoringData]:
-        """Read scoring data for all vehicles"""
-        raw = self._read_scoring_raw()
-        if not raw:
+        """
+        Read scoring data for all vehicles.
+
+        The VehicleScoringData instances are reused, one per grid slot, and
+        overwritten by the next call; copy.copy() any you need to keep.
+        """
+        buf = self.scoring_buffer
+        if buf is None:
             return []
 
-        vehicles = []
-        for i in range(raw.mNumVehicles):
-            veh = self.read_vehicle_scoring(i)
-            if veh:
-                vehicles.append(veh)
-
-        return vehicles
-
-    def read_extended(self) -> Optional[ExtendedData]:
+        # One header read, then a single pass over the packed vehicle records
+        num_vehicles, = SCORING_NUM_VEHICLES.unpack_from(buf)
+        num_vehicles = max(0, min(num_vehicles, MAX_MAPPED_VEHICLES))
+        pool = self._vehicle_pool
+        while len(pool) < num_vehicles:
+            pool.append(VehicleScoringData())
+
+        records = buf[VEHICLE_SCORING_OFFSET:
+                      VEHICLE_SCORING_OFFSET + num_vehicles * VEHICLE_SCORING_SIZE]
+        fill = self._fill_vehicle_scoring
+        return [fill(data, fields)
+                for data, fields in zip(pool, VEHICLE_SCORING.iter_unpack(records))]
+
+    def read_vehicle_scoring_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Numeric scoring data of all vehicles as one array per field.
+
+        Keys and units match VehicleScoringData (speed in km/h, flags as
+        bool); the names are left to read_all_vehicles_scoring(). Cheaper than
+        building a dataclass per car when whole columns are wanted, e.g. gaps
+        or positions for the timing tower.
+        """
+        buf = self.scoring_buffer
+        if buf is None:
+            return {}
+
+        num_vehicles, = SCORING_NUM_VEHICLES.unpack_from(buf)
+        num_vehicles = max(0, min(num_vehicles, MAX_MAPPED_VEHICLES))
+        # Copied out, so the arrays don't pin or alias the mapped view
+        records = np.frombuffer(buf, dtype=VEHICLE_SCORING_DTYPE, count=num_vehicles,
+                                offset=VEHICLE_SCORING_OFFSET).copy()
+
+        columns = {name: records[name] for name in VEHICLE_SCORING_DTYPE.names}
+        columns['speed'] = columns['speed'] * 3.6  # m/s to km/h
+        for name in ('is_player', 'in_pits', 'under_yellow'):
+            columns[name] = columns[name].astype(bool)
+        return columns
+
+    def read_extended(self) -> ExtendedData:
         """Read extended data"""
         raw = self._read_extended_raw()
-        if not raw:
-            return None
+        if raw is None:
+            return INVALID_EXTENDED
 
         data = ExtendedData()
 
-        data.traction_control = raw.mPhysics.mTractionControl
-        data.abs = raw.mPhysics.mAntiLockBrakes
-        data.stability_control = raw.mPhysics.mStabilityControl
-        data.auto_shift = raw.mPhysics.mAutoShift
-        data.fuel_mult = raw.mPhysics.mFuelMult
-        data.tire_mult = raw.mPhysics.mTireMult
+        (
+            data.traction_control, data.abs, data.stability_control, data.auto_shift,
+            data.fuel_mult, data.tire_mult, in_realtime, session_started,
+        ) = EXTENDED.unpack_from(raw)
 
-        data.in_realtime = bool(raw.mInRealtimeFC)
-        data.session_started = bool(raw.mSessionStarted)
+        data.in_realtime = bool(in_realtime)
+        data.session_started = bool(session_started)
 
         return data
 
-    def read_force_feedback(self) -> Optional[float]:
-        """Read force feedback value"""
-        raw = self._read_ffb_raw()
-        if not raw:
-            return None
+    def read_force_feedback(self) -> float:
+        """Read force feedback value, NaN when unavailable or mid-update"""
+        buf = self.ffb_buffer
+        if buf is None:
+            return math.nan
 
-        return raw.mForceValue
+        # Read at FFB rate: one unpack, no retry, the next poll is close behind
+        begin, end, force = FORCE_FEEDBACK.unpack_from(buf)
+        return force if begin == end else math.nan
 
-    def read_all(self) -> Dict[str, Any]:
-        """Read all available data at once"""
+    @staticmethod
+    def _stable_version(buf: Optional[memoryview]) -> Optional[int]:
+        """A map's version, or None when it is missing or mid-update"""
+        if buf is None:
+            return None
+        begin, end = VERSION_COUNTERS.unpack_from(buf)
+        return end if begin == end else None
+
+    def _read_if_updated(self, stream: str, version: Optional[int], read):
+        """
+        read(), or its previous result while the map's version is unchanged.
+
+        rF2 bumps a map's counters on every write to it, session transitions
+        included, so equal counters mean the last result is still current.
+        """
+        cached = self._stream_cache.get(stream)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+
+        result = read()
+        if version is not None and result:
+            self._stream_cache[stream] = (version, result)
+        return result
+
+    def read_all(self, nowait: bool = False) -> Dict[str, Any]:
+        """
+        Read all available data at once.
+
+        Each map's counters are read once up front; streams whose map hasn't
+        been updated since the previous call return the same objects as that
+        call without decoding anything. The decodes run on the calling
+        thread: struct and ctypes hold the GIL throughout, so handing them to
+        worker threads only adds hand-off latency.
+
+        With nowait=True and start_refresh() running, nothing is read: the
+        refresh thread's latest result is returned as is. Its objects are
+        never reused by later refreshes, so they can be kept.
+        """
+        if nowait and self._refresh_thread is not None:
+            return self._latest
+
+        with self._read_lock:
+            return self._read_all()
+
+    def _read_all(self) -> Dict[str, Any]:
+        scoring_version = self._stable_version(self.scoring_buffer)
+        extended_version = self._stable_version(self.extended_buffer)
         return {
-            'telemetry': self.read_telemetry(),
-            'scoring': self.read_scoring(),
-            'player_scoring': self.read_player_scoring(),
-            'extended': self.read_extended(),
-            'force_feedback': self.read_force_feedback(),
+            'telemetry': self.read_telemetry(),  # Version-checked by itself
+            'scoring': self._read_if_updated(
+                'scoring', scoring_version, self.read_scoring),
+            'player_scoring': self._read_if_updated(
+                'player_scoring', scoring_version, self.read_player_scoring),
+            'extended': self._read_if_updated(
+                'extended', extended_version, self.read_extended),
+            'force_feedback': self.read_force_feedback(),  # Counters unpacked with the value
             'timestamp': time.time()
         }
 
+    def start_refresh(self) -> bool:
+        """
+        Decode every rF2 update in a background thread, for read_all(nowait=True).
+
+        Consumers then get the latest data at the cost of an attribute read,
+        whatever their own cadence, and the maps are decoded once per update
+        however many consumers poll. While it runs, read data through
+        read_all() only; the other read_* methods share the thread's buffers.
+        Returns False when not connected.
+        """
+        if not self.connected:
+            return False
+        if self._refresh_thread is None:
+            data = self.read_all()
+            if data['telemetry']:
+                data['telemetry'] = data['telemetry'].copy()
+            self._latest = data
+            self._refresh_stop.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name='rf2-refresh', daemon=True)
+            self._refresh_thread.start()
+        return True
+
+    def stop_refresh(self):
+        """Stop the start_refresh() thread, if running"""
+        thread = self._refresh_thread
+        if thread is not None:
+            self._refresh_stop.set()
+            thread.join()
+            self._refresh_thread = None
+
+    def _refresh_loop(self):
+        # Telemetry is published far more often than the other maps, so its
+        # counter paces the loop; the timeout still picks up scoring and
+        # extended updates while the game is paused
+        published_key = published = None
+        while not self._refresh_stop.is_set():
+            self.wait_for_update(
+                'telemetry', REFRESH_IDLE_TIMEOUT, max_interval=REFRESH_MAX_SLEEP)
+            with self._read_lock:
+                data = self._read_all()
+                key = (self._telemetry_version, self._telemetry_sections)
+
+            # read_telemetry() recycles two buffers, and a plain read_all() may
+            # refill them between two passes; publish a copy of each new frame,
+            # keyed on its version, so a consumer's frame is never refilled
+            # under it
+            telemetry = data['telemetry']
+            if not telemetry:
+                published_key, published = None, telemetry
+            elif key != published_key:
+                published_key, published = key, telemetry.copy()
+            data['telemetry'] = published
+            self._latest = data
+
 
 # ============= TEST =============
 
@@ -994,38 +1543,48 @@ if __name__ == "__main__":
 
         while True:
             try:
+                # Read right after a publish instead of at an arbitrary point
+                # of the frame; also idles cheaply while the game is paused
+                reader.wait_for_update('telemetry', timeout=0.5)
                 data = reader.read_all()
+                out = []  # Written in one go, not a locked print per line
 
                 if data['telemetry']:
                     t = data['telemetry']
-                    print(f"\n--- Telemetry ---")
-                    print(f"Vehicle: {t.vehicle_name}")
-                    print(f"Track: {t.track_name}")
-                    print(f"Speed: {t.speed_kmh:.1f} km/h")
-                    print(f"RPM: {t.rpm:.0f} / {t.rpm_max:.0f}")
-                    print(f"Gear: {t.gear}")
-                    print(f"Fuel: {t.fuel:.1f}L ({t.fuel_pct:.1f}%)")
-                    print(f"Water: {t.water_temp:.1f}°C | Oil: {t.oil_temp:.1f}°C")
-                    print(f"G-Force: Long {t.g_long:.2f}g | Lat {t.g_lat:.2f}g")
-                    print(f"Tires: FL {t.tire_temp_fl:.0f}°C | FR {t.tire_temp_fr:.0f}°C")
-                    print(f"        RL {t.tire_temp_rl:.0f}°C | RR {t.tire_temp_rr:.0f}°C")
-                    print(f"Brakes: FL {t.brake_temp_fl:.0f}°C | FR {t.brake_temp_fr:.0f}°C")
-                    print(f"Ride Height: F {t.front_ride_height:.1f}mm | R {t.rear_ride_height:.1f}mm")
+                    out.append(f"\n--- Telemetry ---")
+                    out.append(f"Vehicle: {t.vehicle_name}")
+                    out.append(f"Track: {t.track_name}")
+                    out.append(f"Speed: {t.speed_kmh:.1f} km/h")
+                    out.append(f"RPM: {t.rpm:.0f} / {t.rpm_max:.0f}")
+                    out.append(f"Gear: {t.gear}")
+                    out.append(f"Fuel: {t.fuel:.1f}L ({t.fuel_pct:.1f}%)")
+                    out.append(f"Water: {t.water_temp:.1f}°C | Oil: {t.oil_temp:.1f}°C")
+                    out.append(f"G-Force: Long {t.g_long:.2f}g | Lat {t.g_lat:.2f}g")
+                    out.append(f"Tires: FL {t.tire_temp_fl:.0f}°C | FR {t.tire_temp_fr:.0f}°C")
+                    out.append(f"        RL {t.tire_temp_rl:.0f}°C | RR {t.tire_temp_rr:.0f}°C")
+                    out.append(f"Brakes: FL {t.brake_temp_fl:.0f}°C | FR {t.brake_temp_fr:.0f}°C")
+                    out.append(f"Ride Height: F {t.front_ride_height:.1f}mm"
+                               f" | R {t.rear_ride_height:.1f}mm")
 
                 if data['scoring']:
                     s = data['scoring']
-                    print(f"\n--- Scoring ---")
-                    print(f"Track Temp: {s.track_temp:.1f}°C | Ambient: {s.ambient_temp:.1f}°C")
-                    print(f"Rain: {s.raining:.2f} | Wetness: {s.avg_path_wetness:.2f}")
+                    out.append(f"\n--- Scoring ---")
+                    out.append(f"Track Temp: {s.track_temp:.1f}°C"
+                               f" | Ambient: {s.ambient_temp:.1f}°C")
+                    out.append(f"Rain: {s.raining:.2f} | Wetness: {s.avg_path_wetness:.2f}")
 
                 if data['player_scoring']:
                     p = data['player_scoring']
-                    print(f"\n--- Player ---")
-                    print(f"Position: P{p.place} | Lap {p.total_laps}")
-                    print(f"Best Lap: {p.best_lap_time:.3f}s")
-                    print(f"Gap to leader: {p.time_behind_leader:.3f}s")
+                    out.append(f"\n--- Player ---")
+                    out.append(f"Position: P{p.place} | Lap {p.total_laps}")
+                    out.append(f"Best Lap: {p.best_lap_time:.3f}s")
+                    out.append(f"Gap to leader: {p.time_behind_leader:.3f}s")
+
+                if out:
+                    sys.stdout.write('\n'.join(out) + '\n')
+                    sys.stdout.flush()
 
-                time.sleep(0.5)
+                time.sleep(0.5)  # Display rate
 
             except KeyboardInterrupt:
                 break
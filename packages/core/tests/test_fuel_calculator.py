@@ -0,0 +1,42 @@
+"""Tests for the fuel calculator"""
+
+import numpy as np
+import pytest
+
+from agp_core.strategy.fuel_calculator import FuelCalculator
+from agp_core.strategy.models import FuelState
+
+
+@pytest.mark.parametrize("history", [(), (2.9, 3.0, 3.1, 3.3, 3.2, 3.4, 3.5)])
+@pytest.mark.parametrize("current_fuel", [4.0, 40.0, 95.0])
+@pytest.mark.parametrize("current_lap", [0, 12, 58])
+def test_predict_matches_the_helpers(history, current_fuel, current_lap):
+    calculator = FuelCalculator()
+    for fuel_used in history:
+        calculator.update_consumption(fuel_used)
+    fuel_state = FuelState(
+        current_fuel=current_fuel, tank_capacity=100.0, consumption_per_lap=3.0
+    )
+    total_laps = 60
+
+    prediction = calculator.predict(fuel_state, current_lap, total_laps)
+
+    assert prediction.laps_remaining == calculator.calculate_laps_remaining(fuel_state)
+    assert (prediction.pit_window_start, prediction.pit_window_end) == (
+        calculator.calculate_pit_window(fuel_state, current_lap, total_laps)
+    )
+    assert prediction.fuel_needed_to_finish == calculator.calculate_fuel_for_laps(
+        total_laps - current_lap, fuel_state
+    )
+    assert prediction.recommended_fuel_add == calculator.calculate_optimal_fuel_add(
+        fuel_state, total_laps - current_lap
+    )
+
+
+def test_fuel_for_laps_accepts_an_int_lap_array():
+    calculator = FuelCalculator()
+    fuel_state = FuelState(current_fuel=60.0, tank_capacity=60.0, consumption_per_lap=3)
+
+    fuel = calculator.calculate_fuel_for_laps(np.array([10, 20]), fuel_state)
+
+    assert fuel.tolist() == [34.5, 64.5]
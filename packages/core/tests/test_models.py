@@ -0,0 +1,34 @@
+"""Tests for the strategy data models"""
+
+import pytest
+
+from agp_core.strategy.models import TIRE_CLIFF_LAPS, TireCompound, TireState
+
+
+def _worn(compound, age_laps, wear):
+    return TireState(
+        compound=compound, age_laps=age_laps,
+        wear_fl=wear, wear_fr=wear, wear_rl=wear, wear_rr=wear,
+    )
+
+
+@pytest.mark.parametrize("compound", list(TireCompound))
+def test_new_set_lasts_until_the_cliff(compound):
+    assert TireState(compound=compound).estimated_laps_remaining == TIRE_CLIFF_LAPS[compound]
+
+
+def test_light_wear_is_capped_by_the_cliff():
+    # 1%/lap leaves 70 laps of wear, but the medium cliff is 18 laps away
+    tires = _worn(TireCompound.MEDIUM, age_laps=10, wear=90.0)
+    assert tires.estimated_laps_remaining == TIRE_CLIFF_LAPS[TireCompound.MEDIUM] - 10
+
+
+def test_heavy_wear_ends_before_the_cliff():
+    # 4%/lap with 40% left above the 20% minimum
+    tires = _worn(TireCompound.MEDIUM, age_laps=10, wear=60.0)
+    assert tires.estimated_laps_remaining == 10
+
+
+def test_past_the_cliff_no_laps_remain():
+    tires = _worn(TireCompound.SOFT, age_laps=TIRE_CLIFF_LAPS[TireCompound.SOFT] + 5, wear=80.0)
+    assert tires.estimated_laps_remaining == 0
@@ -0,0 +1,121 @@
+"""Tests for the strategy engine plan scoring"""
+
+import numpy as np
+import pytest
+
+from agp_core.strategy.models import (
+    TIRE_CLIFF_LAPS,
+    FuelState,
+    TireCompound,
+    TireState,
+    WeatherCondition,
+    WeatherForecast,
+)
+from agp_core.strategy.strategy_engine import _TIRE_CLIFF, _TIRE_DEG, StrategyEngine
+from agp_core.strategy.strategy_engine_kernels import score_plans
+from agp_core.strategy.tire_predictor import COMPOUNDS, TirePredictor
+
+
+@pytest.mark.parametrize("index", range(len(COMPOUNDS)))
+def test_stint_cost_matches_predictor_time_loss(index):
+    compound = COMPOUNDS[index]
+    predictor = TirePredictor()
+    new_set = TireState(compound=compound)
+    rate = TirePredictor.DEGRADATION_RATES[compound]
+
+    for laps in range(1, TIRE_CLIFF_LAPS[compound] + 1):
+        # One stint, no stop: the kernel cost is the tire cost alone
+        cost = score_plans(
+            np.array([0]),
+            np.array([[laps]]),
+            _TIRE_DEG[[[index]]],
+            _TIRE_CLIFF[[[index]]],
+            pit_loss=25.0,
+        )[0]
+        expected = predictor.calculate_time_loss(new_set, laps, rate)
+        assert cost == pytest.approx(expected, rel=0.25, abs=0.5), (compound, laps)
+
+
+def _engine(total_laps, current_lap):
+    engine = StrategyEngine()
+    engine.set_race_info(total_laps=total_laps)
+    engine.update_fuel(FuelState(current_fuel=50.0, tank_capacity=100.0, consumption_per_lap=3.0))
+    engine.update_lap(current_lap)
+    return engine
+
+
+def test_predictions_follow_race_info_assigned_directly():
+    engine = _engine(total_laps=100, current_lap=10)
+    engine.get_fuel_prediction()
+    engine.to_dict()
+
+    engine.current_lap = 15
+    engine.total_laps = 80
+    expected = _engine(total_laps=80, current_lap=15).get_fuel_prediction()
+
+    assert engine.get_fuel_prediction() == expected
+    assert engine.to_dict()["fuel_prediction"] == expected.to_dict()
+
+
+def test_undercut_cache_is_bounded():
+    engine = _engine(total_laps=100, current_lap=10)
+    for i in range(StrategyEngine.UNDERCUT_CACHE_SIZE * 4):
+        engine.analyze_undercut("Car 2", 10.0 + i / 1000, target_tire_age=20)
+
+    assert len(engine._undercut_cache[1]) == StrategyEngine.UNDERCUT_CACHE_SIZE
+
+
+def _stint_laps(plan):
+    return [stint.end_lap - stint.start_lap for stint in plan.stints]
+
+
+def test_optimal_strategy_fits_stints_in_the_tank():
+    engine = StrategyEngine()
+    engine.set_race_info(total_laps=100)
+    unconstrained = engine.calculate_optimal_strategy()
+
+    # 60 l at 3 l/lap: no stint may be longer than 20 laps
+    engine.update_fuel(FuelState(current_fuel=60.0, tank_capacity=60.0, consumption_per_lap=3.0))
+    plan = engine.calculate_optimal_strategy()
+
+    assert max(_stint_laps(unconstrained)) > 20
+    assert max(_stint_laps(plan)) <= 20
+    assert sum(_stint_laps(plan)) == 100
+    assert [stop.lap for stop in plan.pit_stops] == [s.start_lap for s in plan.stints[1:]]
+
+
+def test_optimal_strategy_falls_back_to_max_stops_when_nothing_fits():
+    engine = StrategyEngine()
+    engine.set_race_info(total_laps=100)
+    engine.update_fuel(FuelState(current_fuel=10.0, tank_capacity=10.0, consumption_per_lap=3.0))
+
+    plan = engine.calculate_optimal_strategy(max_stops=3)
+
+    assert len(plan.pit_stops) == 3
+    assert len(plan.stints) == 4
+
+
+@pytest.mark.parametrize("condition, compound", [
+    (WeatherCondition.DRY, TireCompound.MEDIUM),
+    (WeatherCondition.LIGHT_RAIN, TireCompound.INTERMEDIATE),
+    (WeatherCondition.HEAVY_RAIN, TireCompound.WET),
+])
+def test_optimal_strategy_follows_the_forecast(condition, compound):
+    engine = StrategyEngine()
+    engine.set_race_info(total_laps=90)
+    engine.update_weather(WeatherForecast(
+        current_condition=WeatherCondition.DRY,
+        track_temp=30.0,
+        air_temp=20.0,
+        rain_probability=0.5,
+        forecast_changes=[(40, condition)],
+    ))
+
+    plan = engine.calculate_optimal_strategy(min_stops=2, max_stops=2)
+
+    # Stops at laps 30 and 60: only the last stint starts after the change
+    assert [stop.lap for stop in plan.pit_stops] == [30, 60]
+    assert [s.tire_compound for s in plan.stints] == [
+        TireCompound.MEDIUM, TireCompound.MEDIUM, compound,
+    ]
+    assert plan.pit_stops[-1].tire_compound == compound